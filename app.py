@@ -5,13 +5,100 @@ A user-friendly interface for scraping Carousell.sg listings
 
 import streamlit as st
 import pandas as pd
-import sys
-from pathlib import Path
+import asyncio
+import atexit
+import io
+
+# The scraper module is installed from src/ (pip install -e .). It is imported
+# lazily inside the functions below, so widget reruns don't pay for Selenium
+
+
+@st.cache_resource
+def _active_pool() -> dict:
+    """Holder for the one browser pool that is currently open"""
+    holder = {}
+    # Cached resources have no teardown hook, so quit the browsers on server exit
+    def close_pool():
+        if 'pool' in holder:
+            holder['pool'].close()
+
+    atexit.register(close_pool)
+    return holder
+
+
+# Only one pool is kept: changing a setting replaces it instead of starting
+# another set of browsers next to it
+@st.cache_resource(max_entries=1, show_spinner="Starting browser...")
+def get_browser_pool(size: int, headless: bool, fast_mode: bool):
+    """Create the browser pool once and share it across reruns and sessions"""
+    from carousell_scraper import BrowserPool, FAST_BROWSER_ARGS
+
+    # Eviction doesn't close the previous pool, so close it here. Searches other
+    # sessions are running on it finish first, their browsers quit on release
+    holder = _active_pool()
+    previous = holder.pop('pool', None)
+    if previous is not None:
+        previous.close()
+
+    browser_args = FAST_BROWSER_ARGS if fast_mode else None
+    holder['pool'] = BrowserPool(size=size, headless=headless, browser_args=browser_args)
+    return holder['pool']
+
+
+# Result fields in display order, mapped to their column titles
+RESULT_COLUMNS = {
+    'query': 'Search Term',
+    'item_name': 'Item Name',
+    'price': 'Price',
+    'condition': 'Condition',
+    'seller': 'Seller',
+    'time': 'Time',
+    'url': 'URL',
+}
+
+
+class NoResultsFound(Exception):
+    """Raised by cached_scrape so that searches without results are not cached"""
+
+
+# cache_resource hands back the stored list itself instead of unpickling a copy
+# on every hit; the results are treated as read-only below
+@st.cache_resource(ttl=600, show_spinner=False)
+def cached_scrape(search_terms: tuple, max_results: int, headless: bool,
+                  _pool_size: int, _max_concurrency: int, _fast_mode: bool) -> list:
+    """
+    Scrape all search terms, reusing the results of identical searches for 10 minutes
+
+    The debug screenshot is kept out of the cache and stored in
+    st.session_state['debug_screenshot'] instead.
+    """
+    from carousell_scraper import search_batch
+
+    # Run every search term concurrently on browsers from the pool
+    pool = get_browser_pool(_pool_size, headless, _fast_mode)
+    debug_screenshots = {}
+    results_by_query = asyncio.run(search_batch(
+        pool,
+        list(search_terms),
+        max_results=max_results,
+        max_concurrency=_max_concurrency,
+        debug_screenshots=debug_screenshots,
+    ))
+
+    if len(search_terms) > 1:
+        results = [
+            {'query': query, **item}
+            for query, items in results_by_query.items()
+            for item in items
+        ]
+    else:
+        results = results_by_query[search_terms[0]]
 
-# Add src directory to path
-sys.path.append(str(Path(__file__).parent / "src"))
+    if not results:
+        st.session_state['debug_screenshot'] = next(iter(debug_screenshots.values()), None)
+        raise NoResultsFound()
 
-from carousell_scraper import scrape_carousell
+    return results
 
 
 # Page configuration
@@ -29,7 +116,7 @@ Simply enter your search term and the maximum number of results you want to retr
 """)
 
 # Add warnings
-st.warning("⚠️ Please use this tool responsibly and respect Carousell's terms of service. The scraper includes delays to avoid overwhelming the server.")
+st.warning("⚠️ Please use this tool responsibly and respect Carousell's terms of service. Searches run without delays, so keep the number of concurrent searches low.")
 st.info("💡 **Tip:** Keep 'Headless Mode' disabled in the sidebar for best results. Headless mode often triggers CAPTCHA verification.")
 
 # Sidebar for settings
@@ -49,6 +136,28 @@ with st.sidebar:
         help="Run browser in headless mode (no visible window). Note: Headless mode may trigger CAPTCHA - keep this unchecked for better results."
     )
 
+    fast_mode = st.checkbox(
+        "⚡ Fast Mode",
+        value=False,
+        help="Use a smaller browser window (800x600), which has less to render on every scroll"
+    )
+
+    pool_size = st.number_input(
+        "Browser Pool Size",
+        min_value=1,
+        max_value=4,
+        value=1,
+        help="Number of browsers kept open between searches. Browsers are started once and reused, which skips the browser startup on every search."
+    )
+
+    max_concurrency = st.slider(
+        "Max Concurrent Searches",
+        min_value=1,
+        max_value=5,
+        value=5,
+        help="Maximum number of search terms scraped at the same time. Limited by the browser pool size."
+    )
+
     st.markdown("---")
     st.markdown("""
     ### About
@@ -60,37 +169,43 @@ with st.sidebar:
     - **Posting Time**
     - **Product URL**
 
-    ### Safety Features
-    - Random delays between requests (2-5 seconds)
-    - Human-like scrolling behavior
-    - Proper browser headers
-    - Rate limiting
+    ### Load on Carousell
+    - At most the chosen number of searches run at once, limited by the browser pool size
+    - No delays between requests; pages are scrolled only until enough listings have loaded
+    - Identical searches are answered from cache for 10 minutes
+    - Images, fonts, video and analytics requests are blocked
     """)
 
 # Main content area
-col1, col2 = st.columns([3, 1])
-
-with col1:
-    search_query = st.text_input(
-        "🔍 Search Term",
-        value="rolex daytona" if dev_mode else "",
-        placeholder="e.g., laptop, iPhone, furniture",
-        help="Enter what you want to search for on Carousell.sg"
-    )
-
-with col2:
-    max_results = st.number_input(
-        "Max Results",
-        min_value=1,
-        max_value=100,
-        value=5,
-        step=5,
-        help="Maximum number of results to retrieve"
-    )
-
-# Search button
-if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
-    if not search_query:
+# Inputs live in a form so typing doesn't rerun the script until submitted
+with st.form("scrape_form"):
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        search_query = st.text_input(
+            "🔍 Search Term",
+            value="rolex daytona" if dev_mode else "",
+            placeholder="e.g., laptop, iPhone, furniture",
+            help="Enter what you want to search for on Carousell.sg. Separate multiple search terms with commas."
+        )
+
+    with col2:
+        max_results = st.number_input(
+            "Max Results",
+            min_value=1,
+            max_value=100,
+            value=5,
+            step=5,
+            help="Maximum number of results to retrieve"
+        )
+
+    # Search button
+    submitted = st.form_submit_button("🚀 Start Scraping", type="primary", use_container_width=True)
+
+if submitted:
+    search_terms = [term.strip() for term in search_query.split(",") if term.strip()]
+
+    if not search_terms:
         st.error("❌ Please enter a search term!")
     else:
         # Create a placeholder for status updates
@@ -102,16 +217,18 @@ if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
             st.caption("This may take a while depending on the number of results. Please be patient.")
 
         try:
-            # Perform the scraping using context manager to get scraper instance
-            from carousell_scraper import CarousellScraper
-            scraper = CarousellScraper(headless=headless_mode)
-
+            st.session_state['debug_screenshot'] = None
             try:
-                results = scraper.search(query=search_query, max_results=max_results)
-            finally:
-                # Store screenshot before closing
-                debug_screenshot = scraper.debug_screenshot
-                scraper.close()
+                results = cached_scrape(
+                    tuple(search_terms),
+                    max_results,
+                    headless_mode,
+                    pool_size,
+                    max_concurrency,
+                    fast_mode,
+                )
+            except NoResultsFound:
+                results = []
 
             progress_bar.progress(100)
             status_placeholder.empty()
@@ -120,51 +237,26 @@ if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
             if results:
                 st.success(f"✅ Successfully scraped {len(results)} items!")
 
-                # Convert to DataFrame
-                df = pd.DataFrame(results)
-
-                # Reorder columns for better display
-                column_order = []
-                if 'item_name' in df.columns:
-                    column_order.append('item_name')
-                if 'price' in df.columns:
-                    column_order.append('price')
-                if 'condition' in df.columns:
-                    column_order.append('condition')
-                if 'seller' in df.columns:
-                    column_order.append('seller')
-                if 'time' in df.columns:
-                    column_order.append('time')
-                if 'url' in df.columns:
-                    column_order.append('url')
-
-                if column_order:
-                    df = df[column_order]
-
-                # Display statistics (before capitalizing headers)
+                # Build the DataFrame with columns already ordered and titled
+                present_fields = set().union(*results)
+                df = pd.DataFrame(
+                    results,
+                    columns=[c for c in RESULT_COLUMNS if c in present_fields]
+                ).rename(columns=RESULT_COLUMNS)
+
+                # Display statistics
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total Items", len(results))
                 with col2:
                     # Count items with valid prices
-                    valid_prices = df[df['price'] != 'N/A']['price'].count() if 'price' in df.columns else 0
+                    valid_prices = int((df['Price'].to_numpy() != 'N/A').sum()) if 'Price' in df.columns else 0
                     st.metric("Items with Price", valid_prices)
                 with col3:
                     # Count items with valid URLs
-                    valid_urls = df[df['url'] != 'N/A']['url'].count() if 'url' in df.columns else 0
+                    valid_urls = int((df['URL'].to_numpy() != 'N/A').sum()) if 'URL' in df.columns else 0
                     st.metric("Valid Links", valid_urls)
 
-                # Rename columns to proper titles
-                column_rename = {
-                    'item_name': 'Item Name',
-                    'price': 'Price',
-                    'condition': 'Condition',
-                    'seller': 'Seller',
-                    'time': 'Time',
-                    'url': 'URL'
-                }
-                df = df.rename(columns=column_rename)
-
                 st.markdown("---")
 
                 # Display table with clickable links
@@ -208,11 +300,14 @@ if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
 
                 # Download button
                 st.markdown("---")
-                csv = df.to_csv(index=False)
+                # Write the CSV straight into a byte buffer
+                csv_buffer = io.BytesIO()
+                df.to_csv(csv_buffer, index=False, encoding='utf-8')
+                csv_buffer.seek(0)
                 st.download_button(
                     label="📥 Download Results as CSV",
-                    data=csv,
-                    file_name=f"carousell_{search_query.replace(' ', '_')}.csv",
+                    data=csv_buffer,
+                    file_name=f"carousell_{'_'.join(search_terms).replace(' ', '_')}.csv",
                     mime="text/csv"
                 )
 
@@ -221,10 +316,10 @@ if st.button("🚀 Start Scraping", type="primary", use_container_width=True):
                 st.info("💡 Try a different search term or check if the website is accessible.")
 
                 # Display debug screenshot if available
-                if debug_screenshot:
+                if st.session_state['debug_screenshot']:
                     st.subheader("🔍 Debug Screenshot")
                     st.caption("This is what the browser saw when trying to scrape:")
-                    st.image(debug_screenshot, caption="Page Screenshot", use_container_width=True)
+                    st.image(st.session_state['debug_screenshot'], caption="Page Screenshot", use_container_width=True)
 
         except Exception as e:
             progress_bar.empty()
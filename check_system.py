@@ -7,7 +7,9 @@ Checks if all required dependencies and browsers are installed
 import sys
 import shutil
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import distribution, PackageNotFoundError
 
 
 def check_python_version():
@@ -28,6 +30,36 @@ def check_python_version():
         return False
 
 
+@lru_cache(maxsize=None)
+def _which(cmd):
+    """Cached shutil.which lookup"""
+    return shutil.which(cmd)
+
+
+@lru_cache(maxsize=None)
+def _version(cmd):
+    """Cached output of `cmd --version`, or None if it could not be run"""
+    try:
+        result = subprocess.run(
+            [cmd, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        return result.stdout.strip()
+    except:
+        return None
+
+
+def _probe_browser(commands):
+    """Return (path, version) for the first command found, or None"""
+    for cmd in commands:
+        path = _which(cmd)
+        if path:
+            return path, _version(cmd)
+    return None
+
+
 def check_browsers():
     """Check which browsers are installed"""
     print("\n" + "=" * 70)
@@ -40,29 +72,19 @@ def check_browsers():
         'Firefox': ['firefox'],
     }
 
+    # Probe all browsers in parallel so the version timeouts don't add up
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        probes = list(executor.map(_probe_browser, browsers.values()))
+
     found_browsers = []
 
-    for browser_name, commands in browsers.items():
-        for cmd in commands:
-            path = shutil.which(cmd)
-            if path:
-                # Try to get version
-                try:
-                    result = subprocess.run(
-                        [cmd, '--version'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    version = result.stdout.strip()
-                    print(f"✓ {browser_name} found: {path}")
-                    print(f"  Version: {version}")
-                    found_browsers.append(browser_name)
-                    break
-                except:
-                    print(f"✓ {browser_name} found: {path}")
-                    found_browsers.append(browser_name)
-                    break
+    for browser_name, probe in zip(browsers, probes):
+        if probe:
+            path, version = probe
+            print(f"✓ {browser_name} found: {path}")
+            if version is not None:
+                print(f"  Version: {version}")
+            found_browsers.append(browser_name)
 
     if not found_browsers:
         print("\n✗ No browsers found!")
@@ -92,9 +114,10 @@ def check_python_packages():
 
     for package in required_packages:
         try:
-            __import__(package)
+            # Read the installed metadata instead of importing the package
+            distribution(package)
             print(f"✓ {package} is installed")
-        except ImportError:
+        except PackageNotFoundError:
             print(f"✗ {package} is NOT installed")
             missing_packages.append(package)
 
@@ -133,15 +156,11 @@ def test_scraper_import():
     print("=" * 70)
 
     try:
-        # Add src directory to path
-        sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-        from carousell_scraper import CarousellScraper
+        from carousell_scraper import detect_browser
         print("✓ Scraper module can be imported")
 
         # Try to detect browser
-        scraper = CarousellScraper()
-        browser = scraper._detect_browser()
+        browser = detect_browser()
 
         if browser:
             print(f"✓ Auto-detected browser: {browser}")
@@ -4,198 +4,443 @@ Diagnostic script to identify browser/driver issues
 """
 
 import os
+import re
+import shlex
+import signal
 import subprocess
 import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a diagnostic probe and the output it produced"""
+    name: str
+    ok: Optional[bool]
+    log_lines: List[str] = field(default_factory=list)
+
+
+@lru_cache(maxsize=None)
+def _path_index():
+    """Map executable names to their full path with one sweep over $PATH"""
+    index = {}
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Earlier PATH entries win, like shutil.which, but only
+                    # executables count so a stray file can't hide a later one
+                    if entry.name in index:
+                        continue
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            index[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return index
+
+
+def _which(cmd):
+    """shutil.which backed by the cached PATH index"""
+    if os.name == "nt":
+        # Windows lookups depend on PATHEXT, leave them to shutil
+        return shutil.which(cmd)
+    return _path_index().get(cmd)
+
+
+def run_bounded(cmd, timeout):
+    """
+    Run a command and capture its output, killing its whole process group on timeout
+
+    subprocess.run only kills the direct child, so a grandchild that keeps the
+    output pipe open (e.g. a browser spawning helpers) can stall it far past
+    the timeout.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+        process.communicate(timeout=5)
+        raise
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def _first_executable(candidates):
+    """Full path of the first candidate found on $PATH, in preference order"""
+    for cmd in candidates:
+        path = _which(cmd)
+        if path:
+            return path
+    return None
+
+
+# How long a driver installed by webdriver-manager is trusted without rechecking
+DRIVER_CACHE_TTL = 24 * 60 * 60
+
+CHROMIUM_COMMANDS = ["chromium-browser", "chromium", "google-chrome", "chrome"]
+FIREFOX_COMMANDS = ["firefox"]
+
+# Printed between browsers in the batched version check
+_VERSION_SEPARATOR = "---carousell-diagnose---"
+_versions_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _batched_browser_versions():
+    """
+    Get the version of every installed browser with a single shell call
+
+    Returns a {path: version} dict, or an empty dict if the batched call
+    failed and each browser has to be asked separately.
+    """
+    browser_paths = (_first_executable(CHROMIUM_COMMANDS), _first_executable(FIREFOX_COMMANDS))
+    paths = [path for path in browser_paths if path]
+    if not paths or not _which("sh"):
+        return {}
+
+    script = "; ".join(
+        f"{shlex.quote(path)} --version || exit 1; echo {_VERSION_SEPARATOR}"
+        for path in paths
+    )
+    try:
+        result = run_bounded(["sh", "-c", script], timeout=10 * len(paths))
+    except Exception:
+        return {}
+
+    if result.returncode != 0:
+        return {}
+
+    outputs = result.stdout.split(_VERSION_SEPARATOR + "\n")
+    return {path: output.strip() for path, output in zip(paths, outputs)}
+
+
+def _browser_version(path):
+    """Version string of a browser binary, from the batched check if possible"""
+    # Both browser probes run in parallel; only one of them runs the batch
+    with _versions_lock:
+        versions = _batched_browser_versions()
+
+    if path in versions:
+        return versions[path]
+
+    result = run_bounded([path, "--version"], timeout=10)
+    return result.stdout.strip()
+
+
+# One "<lib> => <path>" or "<lib> => not found" line of ldd output
+_LDD_LINE = re.compile(r"^\s*(\S+)\s+=>\s*(not found)?", re.MULTILINE)
+_IMPORTANT_LIB = re.compile(r"lib(?:nss|nspr|gobject|gdk)")
+
+
+def _subdirs(path):
+    """Directory entries directly inside path"""
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _version_key(name):
+    """Sort key that orders version directory names numerically"""
+    return tuple(int(part) for part in name.split(".") if part.isdigit())
+
+
+def _find_chromedriver(wdm_path):
+    """
+    Find the newest chromedriver downloaded by webdriver-manager
+
+    The cache layout is fixed
+    (<platform>/<version>/[chromedriver-<platform>/]chromedriver), so only
+    those levels are walked instead of searching the whole tree.
+    """
+    version_dirs = [
+        version_dir
+        for platform_dir in _subdirs(wdm_path)
+        for version_dir in _subdirs(platform_dir.path)
+    ]
+
+    for version_dir in sorted(version_dirs, key=lambda entry: _version_key(entry.name), reverse=True):
+        candidate = os.path.join(version_dir.path, "chromedriver")
+        if os.path.isfile(candidate):
+            return Path(candidate)
+
+        for arch_dir in _subdirs(version_dir.path):
+            candidate = os.path.join(arch_dir.path, "chromedriver")
+            if os.path.isfile(candidate):
+                return Path(candidate)
+
+    return None
 
 
 def check_chromedriver_deps():
     """Check if ChromeDriver has all required dependencies"""
-    print("=" * 70)
-    print("Checking ChromeDriver Dependencies...")
-    print("=" * 70)
+    log = [
+        "=" * 70,
+        "Checking ChromeDriver Dependencies...",
+        "=" * 70,
+    ]
 
     # Find chromedriver
     wdm_path = Path.home() / ".wdm" / "drivers" / "chromedriver"
 
     if not wdm_path.exists():
-        print("ChromeDriver not yet downloaded by webdriver-manager")
-        return None
+        log.append("ChromeDriver not yet downloaded by webdriver-manager")
+        return ProbeResult("ChromeDriver Dependencies", None, log)
 
     # Find the most recent chromedriver
-    chromedriver_paths = list(wdm_path.rglob("chromedriver"))
+    chromedriver = _find_chromedriver(wdm_path)
 
-    if not chromedriver_paths:
-        print("No ChromeDriver found in ~/.wdm")
-        return None
+    if not chromedriver:
+        log.append("No ChromeDriver found in ~/.wdm")
+        return ProbeResult("ChromeDriver Dependencies", None, log)
 
-    chromedriver = chromedriver_paths[0]
-    print(f"Found ChromeDriver: {chromedriver}")
+    log.append(f"Found ChromeDriver: {chromedriver}")
 
     # Check dependencies with ldd
     try:
-        result = subprocess.run(
-            ["ldd", str(chromedriver)],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        result = run_bounded(["ldd", str(chromedriver)], timeout=10)
 
-        print("\nChecking shared library dependencies...\n")
+        log.append("\nChecking shared library dependencies...\n")
 
         missing = []
-        for line in result.stdout.split('\n'):
-            if "not found" in line:
-                lib = line.split("=>")[0].strip()
+        for match in _LDD_LINE.finditer(result.stdout):
+            lib, not_found = match.groups()
+            if not_found:
                 missing.append(lib)
-                print(f"✗ MISSING: {lib}")
-            elif "=>" in line and line.strip():
-                lib = line.split("=>")[0].strip()
-                # Only show important ones
-                if any(x in lib for x in ['libnss', 'libnspr', 'libgobject', 'libgdk']):
-                    print(f"✓ Found: {lib}")
+                log.append(f"✗ MISSING: {lib}")
+            # Only show important ones
+            elif _IMPORTANT_LIB.search(lib):
+                log.append(f"✓ Found: {lib}")
 
         if missing:
-            print(f"\n✗ Missing {len(missing)} required libraries!")
-            print("\nTo fix, run:")
-            print("  sudo apt update")
-            print("  sudo apt install -y libnss3 libnss3-dev libnspr4 libnspr4-dev")
-            return False
+            log.append(f"\n✗ Missing {len(missing)} required libraries!")
+            log.append("\nTo fix, run:")
+            log.append("  sudo apt update")
+            log.append("  sudo apt install -y libnss3 libnss3-dev libnspr4 libnspr4-dev")
+            return ProbeResult("ChromeDriver Dependencies", False, log)
         else:
-            print("\n✓ All ChromeDriver dependencies satisfied!")
-            return True
+            log.append("\n✓ All ChromeDriver dependencies satisfied!")
+            return ProbeResult("ChromeDriver Dependencies", True, log)
 
     except Exception as e:
-        print(f"Error checking dependencies: {e}")
-        return None
+        log.append(f"Error checking dependencies: {e}")
+        return ProbeResult("ChromeDriver Dependencies", None, log)
 
 
 def check_firefox():
     """Check if Firefox is properly installed"""
-    print("\n" + "=" * 70)
-    print("Checking Firefox...")
-    print("=" * 70)
+    log = [
+        "\n" + "=" * 70,
+        "Checking Firefox...",
+        "=" * 70,
+    ]
 
-    firefox_path = shutil.which("firefox")
+    firefox_path = _first_executable(FIREFOX_COMMANDS)
 
     if not firefox_path:
-        print("✗ Firefox not found")
-        print("\nTo install Firefox:")
-        print("  sudo apt update && sudo apt install -y firefox")
-        return False
+        log.append("✗ Firefox not found")
+        log.append("\nTo install Firefox:")
+        log.append("  sudo apt update && sudo apt install -y firefox")
+        return ProbeResult("Firefox", False, log)
 
-    print(f"✓ Firefox found: {firefox_path}")
+    log.append(f"✓ Firefox found: {firefox_path}")
 
     # Try to get version
     try:
-        result = subprocess.run(
-            ["firefox", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        print(f"  Version: {result.stdout.strip()}")
-        return True
+        log.append(f"  Version: {_browser_version(firefox_path)}")
+        return ProbeResult("Firefox", True, log)
     except Exception as e:
-        print(f"  Warning: Could not get version: {e}")
-        return True
+        log.append(f"  Warning: Could not get version: {e}")
+        return ProbeResult("Firefox", True, log)
 
 
 def check_chromium():
     """Check if Chromium is properly installed"""
-    print("\n" + "=" * 70)
-    print("Checking Chromium...")
-    print("=" * 70)
+    log = [
+        "\n" + "=" * 70,
+        "Checking Chromium...",
+        "=" * 70,
+    ]
 
-    chromium_commands = ["chromium-browser", "chromium", "google-chrome", "chrome"]
-    chromium_path = None
-
-    for cmd in chromium_commands:
-        path = shutil.which(cmd)
-        if path:
-            chromium_path = path
-            print(f"✓ Chromium found: {path}")
-            break
+    chromium_path = _first_executable(CHROMIUM_COMMANDS)
 
     if not chromium_path:
-        print("✗ Chromium/Chrome not found")
-        print("\nTo install Chromium:")
-        print("  sudo apt update && sudo apt install -y chromium-browser")
-        return False
+        log.append("✗ Chromium/Chrome not found")
+        log.append("\nTo install Chromium:")
+        log.append("  sudo apt update && sudo apt install -y chromium-browser")
+        return ProbeResult("Chromium", False, log)
+
+    log.append(f"✓ Chromium found: {chromium_path}")
 
     # Try to get version
     try:
-        result = subprocess.run(
-            [chromium_path, "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        print(f"  Version: {result.stdout.strip()}")
+        log.append(f"  Version: {_browser_version(chromium_path)}")
     except Exception as e:
-        print(f"  Warning: Could not get version: {e}")
+        log.append(f"  Warning: Could not get version: {e}")
+
+    return ProbeResult("Chromium", True, log)
+
+
+def _driver_sentinel(key):
+    """File recording the last driver that started with the installed browser"""
+    return Path.home() / ".wdm" / f"verified_{key}"
+
+
+def _installed_browser_version(commands):
+    """Version string of the first installed browser, or None if unknown"""
+    path = _first_executable(commands)
+    if not path:
+        return None
+    try:
+        return _browser_version(path) or None
+    except Exception:
+        return None
+
+
+def _cached_driver_install(manager_cls, key, browser_version):
+    """
+    Install a driver with webdriver-manager, reusing a verified one for a day
+
+    A driver recorded by _record_verified_driver is reused without
+    webdriver-manager's online version check, but only while the browser is
+    still at the version it was verified against. After a browser update
+    webdriver-manager runs again and picks the matching driver.
+    """
+    if browser_version:
+        try:
+            sentinel = _driver_sentinel(key)
+            if time.time() - sentinel.stat().st_mtime < DRIVER_CACHE_TTL:
+                version, path = sentinel.read_text().splitlines()[:2]
+                if version == browser_version and os.path.isfile(path) and os.access(path, os.X_OK):
+                    return path
+        except (OSError, ValueError):
+            pass
+
+    return manager_cls().install()
+
+
+def _record_verified_driver(key, browser_version, path):
+    """Remember a driver that Selenium started successfully with this browser"""
+    if not browser_version:
+        return
+    try:
+        sentinel = _driver_sentinel(key)
+        sentinel.parent.mkdir(parents=True, exist_ok=True)
+        sentinel.write_text(f"{browser_version}\n{path}\n")
+    except OSError:
+        pass
 
-    return True
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Install ChromeDriver once per run, returning (driver path, Chrome version)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    version = _installed_browser_version(CHROMIUM_COMMANDS)
+    return _cached_driver_install(ChromeDriverManager, "chrome", version), version
+
+
+@lru_cache(maxsize=None)
+def get_geckodriver_path():
+    """Install GeckoDriver once per run, returning (driver path, Firefox version)"""
+    from webdriver_manager.firefox import GeckoDriverManager
+    version = _installed_browser_version(FIREFOX_COMMANDS)
+    return _cached_driver_install(GeckoDriverManager, "firefox", version), version
 
 
 def test_selenium_chrome():
     """Try to actually start Chrome with Selenium"""
-    print("\n" + "=" * 70)
-    print("Testing Selenium with Chrome...")
-    print("=" * 70)
+    log = [
+        "\n" + "=" * 70,
+        "Testing Selenium with Chrome...",
+        "=" * 70,
+    ]
 
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
 
-        print("Setting up Chrome driver...")
+        log.append("Setting up Chrome driver...")
 
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
 
-        service = Service(ChromeDriverManager().install())
+        driver_path, browser_version = get_chromedriver_path()
+        service = Service(driver_path)
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
-        print("✓ Successfully started Chrome!")
+        log.append("✓ Successfully started Chrome!")
         driver.quit()
-        return True
+        _record_verified_driver("chrome", browser_version, driver_path)
+        return ProbeResult("Selenium Chrome", True, log)
 
     except Exception as e:
-        print(f"✗ Failed to start Chrome: {e}")
-        return False
+        log.append(f"✗ Failed to start Chrome: {e}")
+        return ProbeResult("Selenium Chrome", False, log)
 
 
 def test_selenium_firefox():
     """Try to actually start Firefox with Selenium"""
-    print("\n" + "=" * 70)
-    print("Testing Selenium with Firefox...")
-    print("=" * 70)
+    log = [
+        "\n" + "=" * 70,
+        "Testing Selenium with Firefox...",
+        "=" * 70,
+    ]
 
     try:
         from selenium import webdriver
         from selenium.webdriver.firefox.options import Options
         from selenium.webdriver.firefox.service import Service
-        from webdriver_manager.firefox import GeckoDriverManager
 
-        print("Setting up Firefox driver...")
+        log.append("Setting up Firefox driver...")
 
         firefox_options = Options()
         firefox_options.add_argument("--headless")
 
-        service = Service(GeckoDriverManager().install())
+        driver_path, browser_version = get_geckodriver_path()
+        service = Service(driver_path)
         driver = webdriver.Firefox(service=service, options=firefox_options)
 
-        print("✓ Successfully started Firefox!")
+        log.append("✓ Successfully started Firefox!")
         driver.quit()
-        return True
+        _record_verified_driver("firefox", browser_version, driver_path)
+        return ProbeResult("Selenium Firefox", True, log)
 
     except Exception as e:
-        print(f"✗ Failed to start Firefox: {e}")
-        return False
+        log.append(f"✗ Failed to start Firefox: {e}")
+        return ProbeResult("Selenium Firefox", False, log)
+
+
+def _run_if_ok(probe_future, test):
+    """Run a follow-up test only if the probe it depends on succeeded"""
+    if probe_future.result().ok:
+        return test()
+    return None
 
 
 def main():
@@ -205,65 +450,85 @@ def main():
     print("=" * 70)
     print()
 
-    # Check browsers
-    chromium_ok = check_chromium()
-    firefox_ok = check_firefox()
+    # The probes mostly wait on subprocesses or browser
+    # startup, so run them in parallel and report their output in order
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        chromium_future = executor.submit(check_chromium)
+        firefox_future = executor.submit(check_firefox)
 
-    # Check ChromeDriver dependencies
-    chromedriver_deps_ok = check_chromedriver_deps()
+        # Driver checks and Selenium tests only run once their browser is found
+        chromedriver_deps_future = executor.submit(_run_if_ok, chromium_future, check_chromedriver_deps)
+        selenium_chrome_future = executor.submit(_run_if_ok, chromium_future, test_selenium_chrome)
+        selenium_firefox_future = executor.submit(_run_if_ok, firefox_future, test_selenium_firefox)
 
-    # Try actual Selenium tests
-    print("\n" + "=" * 70)
-    print("SELENIUM TESTS")
-    print("=" * 70)
+        chromium = chromium_future.result()
+        firefox = firefox_future.result()
+        chromedriver_deps = chromedriver_deps_future.result()
+        selenium_chrome = selenium_chrome_future.result()
+        selenium_firefox = selenium_firefox_future.result()
+
+    # Buffer the rest of the report and write it out in one go
+    lines = []
+
+    for probe in (chromium, firefox, chromedriver_deps):
+        if probe is not None:
+            lines.extend(probe.log_lines)
 
-    selenium_chrome_ok = False
-    selenium_firefox_ok = False
+    lines.append("\n" + "=" * 70)
+    lines.append("SELENIUM TESTS")
+    lines.append("=" * 70)
 
-    if chromium_ok:
-        selenium_chrome_ok = test_selenium_chrome()
+    for probe in (selenium_chrome, selenium_firefox):
+        if probe is not None:
+            lines.extend(probe.log_lines)
 
-    if firefox_ok:
-        selenium_firefox_ok = test_selenium_firefox()
+    chromium_ok = chromium.ok
+    firefox_ok = firefox.ok
+    chromedriver_deps_ok = chromedriver_deps.ok if chromedriver_deps is not None else None
+    selenium_chrome_ok = selenium_chrome is not None and selenium_chrome.ok
+    selenium_firefox_ok = selenium_firefox is not None and selenium_firefox.ok
 
     # Summary
-    print("\n" + "=" * 70)
-    print(" SUMMARY & RECOMMENDATIONS ")
-    print("=" * 70)
+    lines.append("\n" + "=" * 70)
+    lines.append(" SUMMARY & RECOMMENDATIONS ")
+    lines.append("=" * 70)
 
     if selenium_firefox_ok:
-        print("\n✓ FIREFOX WORKS - RECOMMENDED")
-        print("\nYour scraper should work with Firefox.")
-        print("You can start using it now!")
+        lines.append("\n✓ FIREFOX WORKS - RECOMMENDED")
+        lines.append("\nYour scraper should work with Firefox.")
+        lines.append("You can start using it now!")
 
     elif selenium_chrome_ok:
-        print("\n✓ CHROME WORKS - RECOMMENDED")
-        print("\nYour scraper should work with Chrome.")
-        print("You can start using it now!")
+        lines.append("\n✓ CHROME WORKS - RECOMMENDED")
+        lines.append("\nYour scraper should work with Chrome.")
+        lines.append("You can start using it now!")
 
     elif chromium_ok and chromedriver_deps_ok is False:
-        print("\n⚠ CHROME NEEDS DEPENDENCIES")
-        print("\nChrome is installed but ChromeDriver is missing libraries.")
-        print("\nFix it with:")
-        print("  sudo apt update")
-        print("  sudo apt install -y libnss3 libnss3-dev libnspr4 libnspr4-dev")
+        lines.append("\n⚠ CHROME NEEDS DEPENDENCIES")
+        lines.append("\nChrome is installed but ChromeDriver is missing libraries.")
+        lines.append("\nFix it with:")
+        lines.append("  sudo apt update")
+        lines.append("  sudo apt install -y libnss3 libnss3-dev libnspr4 libnspr4-dev")
 
     elif not firefox_ok and not chromium_ok:
-        print("\n✗ NO BROWSER INSTALLED")
-        print("\nYou need to install a browser:")
-        print("\nOption 1 (Recommended): Install Firefox")
-        print("  sudo apt update && sudo apt install -y firefox")
-        print("\nOption 2: Install Chromium + dependencies")
-        print("  sudo apt update")
-        print("  sudo apt install -y chromium-browser libnss3 libnspr4")
+        lines.append("\n✗ NO BROWSER INSTALLED")
+        lines.append("\nYou need to install a browser:")
+        lines.append("\nOption 1 (Recommended): Install Firefox")
+        lines.append("  sudo apt update && sudo apt install -y firefox")
+        lines.append("\nOption 2: Install Chromium + dependencies")
+        lines.append("  sudo apt update")
+        lines.append("  sudo apt install -y chromium-browser libnss3 libnspr4")
 
     else:
-        print("\n⚠ NEEDS ATTENTION")
-        print("\nSome issues were detected. Review the output above.")
-        print("\nQuickest solution: Install Firefox")
-        print("  sudo apt update && sudo apt install -y firefox")
+        lines.append("\n⚠ NEEDS ATTENTION")
+        lines.append("\nSome issues were detected. Review the output above.")
+        lines.append("\nQuickest solution: Install Firefox")
+        lines.append("  sudo apt update && sudo apt install -y firefox")
 
-    print("\n" + "=" * 70)
+    lines.append("\n" + "=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
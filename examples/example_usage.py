@@ -2,60 +2,72 @@
 Example usage of the Carousell.sg scraper
 
 This script demonstrates different ways to use the scraper programmatically.
+Install the project first (pip install -e . from the repository root) so the
+scraper module can be imported.
 """
 
-import sys
-from pathlib import Path
+import asyncio
+import csv
+import re
 
-# Add parent directory to path to import the scraper
-sys.path.append(str(Path(__file__).parent.parent))
+# Numeric part of a price string such as "S$1,234.50"
+PRICE_PATTERN = re.compile(r'[\d,]+(?:\.\d{2})?')
 
-from src.carousell_scraper import scrape_carousell, CarousellScraper
-import pandas as pd
 
-
-def example_1_simple_search():
+def example_1_simple_search(scraper=None):
     """Example 1: Simple search using the convenience function"""
+    from carousell_scraper import scrape_carousell
+
     print("=" * 70)
     print("Example 1: Simple Search for Laptops")
     print("=" * 70)
 
-    results = scrape_carousell(
-        query="laptop",
-        max_results=10,
-        headless=True
-    )
+    if scraper is not None:
+        results = scraper.search("laptop", max_results=10)
+    else:
+        results = scrape_carousell(
+            query="laptop",
+            max_results=10,
+            headless=True
+        )
 
     print(f"\nFound {len(results)} results\n")
 
     for i, item in enumerate(results, 1):
         print(f"Item {i}:")
-        print(f"  Name: {item['name']}")
+        print(f"  Name: {item['item_name']}")
         print(f"  Price: {item['price']}")
         print(f"  URL: {item['url']}")
         print()
 
 
-def example_2_with_context_manager():
+def example_2_with_context_manager(scraper=None):
     """Example 2: Using the scraper with context manager"""
+    from carousell_scraper import CarousellScraper
+
     print("=" * 70)
     print("Example 2: Using Context Manager")
     print("=" * 70)
 
-    with CarousellScraper(headless=True, delay_range=(3, 5)) as scraper:
+    if scraper is not None:
         results = scraper.search("iPhone", max_results=15)
+    else:
+        with CarousellScraper(headless=True, delay_range=(3, 5)) as scraper:
+            results = scraper.search("iPhone", max_results=15)
 
-        print(f"\nFound {len(results)} results\n")
+    print(f"\nFound {len(results)} results\n")
 
-        for item in results[:5]:  # Show first 5 results
-            print(f"Name: {item['name']}")
-            print(f"Price: {item['price']}")
-            print(f"URL: {item['url'][:50]}...")  # Truncate long URLs
-            print("-" * 50)
+    for item in results[:5]:  # Show first 5 results
+        print(f"Name: {item['item_name']}")
+        print(f"Price: {item['price']}")
+        print(f"URL: {item['url'][:50]}...")  # Truncate long URLs
+        print("-" * 50)
 
 
-def example_3_save_to_csv():
+def example_3_save_to_csv(scraper=None):
     """Example 3: Search and save results to CSV"""
+    from carousell_scraper import scrape_carousell
+
     print("=" * 70)
     print("Example 3: Save Results to CSV")
     print("=" * 70)
@@ -63,42 +75,55 @@ def example_3_save_to_csv():
     search_term = "furniture"
     print(f"\nSearching for: {search_term}")
 
-    results = scrape_carousell(
-        query=search_term,
-        max_results=20,
-        headless=True
-    )
+    if scraper is not None:
+        results = scraper.search(search_term, max_results=20)
+    else:
+        results = scrape_carousell(
+            query=search_term,
+            max_results=20,
+            headless=True
+        )
 
     if results:
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
-
-        # Save to CSV
+        # Save to CSV, writing the rows straight from the result dicts
         output_file = f"carousell_{search_term}_results.csv"
-        df.to_csv(output_file, index=False)
+        with open(output_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=results[0].keys())
+            writer.writeheader()
+            writer.writerows(results)
 
         print(f"\n✓ Saved {len(results)} results to {output_file}")
-        print("\nFirst 5 rows of the DataFrame:")
-        print(df.head())
+        print("\nFirst 5 rows:")
+        for item in results[:5]:
+            print(item)
     else:
         print("No results found")
 
 
-def example_4_multiple_searches():
-    """Example 4: Perform multiple searches"""
+def example_4_multiple_searches(scraper=None):
+    """Example 4: Perform multiple searches concurrently"""
+    from carousell_scraper import BrowserPool, search_batch
+
     print("=" * 70)
     print("Example 4: Multiple Searches")
     print("=" * 70)
 
     search_terms = ["laptop", "phone", "camera"]
-    all_results = {}
 
-    with CarousellScraper(headless=True) as scraper:
-        for term in search_terms:
-            print(f"\nSearching for: {term}")
-            results = scraper.search(term, max_results=5)
-            all_results[term] = results
-            print(f"  Found {len(results)} results")
+    print(f"\nSearching for: {', '.join(search_terms)}")
+    if scraper is not None:
+        # A scraper keeps its browser open across search() calls
+        all_results = {term: scraper.search(term, max_results=5) for term in search_terms}
+    else:
+        # A pool of scrapers runs the searches side by side, one browser per term
+        pool = BrowserPool(size=len(search_terms), headless=True)
+        try:
+            all_results = asyncio.run(search_batch(pool, search_terms, max_results=5))
+        finally:
+            pool.close()
+
+    for term, results in all_results.items():
+        print(f"  {term}: found {len(results)} results")
 
     print("\n" + "=" * 70)
     print("Summary")
@@ -108,22 +133,27 @@ def example_4_multiple_searches():
         print(f"\n{term.upper()}:")
         if results:
             for i, item in enumerate(results[:3], 1):  # Show top 3
-                print(f"  {i}. {item['name'][:40]} - {item['price']}")
+                print(f"  {i}. {item['item_name'][:40]} - {item['price']}")
         else:
             print("  No results")
 
 
-def example_5_filter_results():
+def example_5_filter_results(scraper=None):
     """Example 5: Search and filter results"""
+    from carousell_scraper import scrape_carousell
+
     print("=" * 70)
     print("Example 5: Search and Filter Results")
     print("=" * 70)
 
-    results = scrape_carousell(
-        query="laptop",
-        max_results=30,
-        headless=True
-    )
+    if scraper is not None:
+        results = scraper.search("laptop", max_results=30)
+    else:
+        results = scrape_carousell(
+            query="laptop",
+            max_results=30,
+            headless=True
+        )
 
     print(f"\nTotal results: {len(results)}")
 
@@ -138,13 +168,12 @@ def example_5_filter_results():
     # Try to extract numeric price for sorting (basic example)
     def extract_price(price_str):
         """Extract numeric value from price string"""
-        try:
-            import re
-            match = re.search(r'[\d,]+(?:\.\d{2})?', price_str)
-            if match:
+        match = PRICE_PATTERN.search(price_str)
+        if match:
+            try:
                 return float(match.group().replace(',', ''))
-        except:
-            pass
+            except ValueError:
+                pass
         return float('inf')
 
     # Sort by price
@@ -155,7 +184,7 @@ def example_5_filter_results():
     print("-" * 70)
 
     for i, item in enumerate(items_sorted[:5], 1):
-        print(f"{i}. {item['name'][:45]}")
+        print(f"{i}. {item['item_name'][:45]}")
         print(f"   Price: {item['price']}")
         print()
 
@@ -190,13 +219,17 @@ def main():
         return
 
     if choice == 'all':
-        for name, func in examples:
-            print("\n\n")
-            try:
-                func()
-            except Exception as e:
-                print(f"Error in {name}: {str(e)}")
-            print("\n" + "=" * 70)
+        from carousell_scraper import CarousellScraper
+
+        # Share one browser across all examples instead of starting one each
+        with CarousellScraper(headless=True) as scraper:
+            for name, func in examples:
+                print("\n\n")
+                try:
+                    func(scraper=scraper)
+                except Exception as e:
+                    print(f"Error in {name}: {str(e)}")
+                print("\n" + "=" * 70)
     elif choice.isdigit() and 1 <= int(choice) <= len(examples):
         idx = int(choice) - 1
         try:
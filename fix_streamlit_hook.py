@@ -8,6 +8,7 @@ import os
 # Fix for Streamlit's version detection in PyInstaller
 if getattr(sys, 'frozen', False):
     # We're running in a bundle
+    import functools
     import importlib.metadata
 
     # Mock the streamlit package metadata
@@ -23,18 +24,24 @@ if getattr(sys, 'frozen', False):
         def metadata(self):
             return {"Version": self._version}
 
+    _STREAMLIT_VERSION = '1.28.0'
+    _MOCK_STREAMLIT = MockDistribution(_STREAMLIT_VERSION)
+
     # Store original functions
     _original_distribution = importlib.metadata.distribution
     _original_version = importlib.metadata.version
 
+    # Installed metadata can't change inside a bundle, so cache every lookup
+    @functools.lru_cache(maxsize=256)
     def patched_distribution(distribution_name):
         if distribution_name.lower() == 'streamlit':
-            return MockDistribution('1.28.0')
+            return _MOCK_STREAMLIT
         return _original_distribution(distribution_name)
 
+    @functools.lru_cache(maxsize=256)
     def patched_version(distribution_name):
         if distribution_name.lower() == 'streamlit':
-            return '1.28.0'
+            return _STREAMLIT_VERSION
         return _original_version(distribution_name)
 
     # Patch the functions
@@ -4,24 +4,30 @@ This helps handle paths correctly when bundled with PyInstaller
 """
 import sys
 import os
-from pathlib import Path
 
 def main():
+    # Fast exit path that doesn't pay for importing Streamlit
+    if '--help' in sys.argv or '-h' in sys.argv:
+        print(__doc__.strip())
+        return
+
     # Get the directory where the script is located
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
-        application_path = Path(sys._MEIPASS)
+        application_path = sys._MEIPASS
     else:
         # Running as normal Python script
-        application_path = Path(__file__).parent
+        application_path = os.path.dirname(os.path.abspath(__file__))
 
     # Change to application directory
     os.chdir(application_path)
 
     # Add src to path
-    sys.path.insert(0, str(application_path / 'src'))
+    sys.path.insert(0, os.path.join(application_path, 'src'))
 
-    # Set Streamlit config to automatically open browser
+    # Configure Streamlit through the environment only, so its config isn't
+    # merged again from command-line flags
+    os.environ['STREAMLIT_SERVER_HEADLESS'] = 'true'
     os.environ['STREAMLIT_BROWSER_GATHER_USAGE_STATS'] = 'false'
 
     # Import and run streamlit
@@ -31,9 +37,7 @@ def main():
     sys.argv = [
         "streamlit",
         "run",
-        str(application_path / "app.py"),
-        "--server.headless=true",
-        "--browser.gatherUsageStats=false",
+        os.path.join(application_path, "app.py"),
     ]
 
     sys.exit(stcli.main())
@@ -5,8 +5,24 @@ Scrapes product listings from Carousell.sg search results
 
 import os
 import time
+import base64
+import asyncio
+import atexit
+import itertools
+import json
+import logging
+import queue
 import random
+import re
 import shutil
+import socket
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 from selenium import webdriver
@@ -16,10 +32,581 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 
+logger = logging.getLogger(__name__)
+
+# Chrome flags on top of the defaults for faster runs: a smaller viewport means
+# less to lay out and paint on every scroll. GPU, sandbox, /dev/shm and
+# extension flags are already part of every Chrome setup
+FAST_BROWSER_ARGS = [
+    "--window-size=800,600",
+]
+
+# Chrome flags that switch off images, GPU, translation, background work and
+# other subsystems that cost CPU and memory but add nothing to listing text
+LEAN_CHROME_ARGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+    "--disable-ipc-flooding-protection",
+    "--mute-audio",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+]
+
+# Requests Chrome drops before they hit the network. Listing text doesn't need
+# images, fonts, video or analytics, and they make up most of a results page
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook*",
+]
+
+# Chrome profiles persist here between runs, so the HTTP cache stays warm
+# instead of starting from an empty profile. Cookies don't carry over between
+# pooled searches, reset() clears them. Each running scraper holds a lock on
+# its own numbered slot; past MAX_PROFILE_SLOTS a throwaway profile is used
+_PROFILE_ROOT = Path.home() / ".cache" / "carousell-scraper" / "chrome"
+MAX_PROFILE_SLOTS = 8
+_profile_slots_lock = threading.Lock()
+
+# Pooled browsers are restarted after this many searches so that memory growth
+# and stale state in a long-lived browser don't build up
+MAX_USES_PER_INSTANCE = 50
+
+# CSS selectors tried in order for each field, most specific first
+LISTING_SELECTORS = [
+    'article',
+    '[data-testid*="listing-card"]',
+    '[class*="ProductCard"]',
+    '[class*="ListingCard"]',
+]
+FIELD_SELECTORS = {
+    'title': ['h3', 'h4', 'h2', 'p[class*="title"]', '[class*="Title"]', '[data-testid*="title"]'],
+    'price': ['[class*="price"]', '[class*="Price"]', '[data-testid*="price"]', 'span:not([class*="time"])'],
+    'seller': ['[class*="seller"]', '[class*="Seller"]', '[class*="username"]', '[class*="Username"]',
+               '[data-testid*="seller"]', 'a[href*="/u/"]'],
+    'time': ['[class*="time"]', '[class*="Time"]', '[class*="date"]', '[class*="Date"]', '[data-testid*="time"]'],
+    'condition': ['[class*="condition"]', '[class*="Condition"]', '[data-testid*="condition"]'],
+}
+
+# Text patterns for the fallbacks that parse a listing's visible text
+_PRICE_RE = re.compile(r'S?\$\s*[\d,]+(?:\.\d{2})?')
+_TIME_RE = re.compile(r'\d+\s*(second|minute|hour|day|week|month|year)s?\s*ago', re.IGNORECASE)
+# Words that mark the posting time line; the seller name is the line before it
+_TIME_KEYWORDS = ('ago', 'hour', 'minute', 'day')
+_BADGES = frozenset(['buyer protection', 'verified', 'featured'])
+_CONDITION_KEYWORDS = (
+    'brand new', 'like new', 'lightly used', 'mint',
+    'well-maintained', 'heavily used', 'almost new',
+    'excellent condition', 'good condition', 'fair condition',
+)
+
+# Scrolls to the bottom, then waits for the page to settle: a MutationObserver
+# resolves as soon as new product links are added, or once the DOM has had no
+# changes for `quietMs` (capped at four times that, so a busy widget can't
+# stall it). Repeats until `targetLinks` product
+# links have loaded (0 for no target), two scrolls in a row loaded no new
+# links, or `maxScrolls` is reached, and resolves with the number of scrolls
+_SCROLL_UNTIL_STABLE_JS = r"""
+const [maxScrolls, quietMs, targetLinks] = arguments;
+const countLinks = () =>
+    new Set(Array.from(document.querySelectorAll('a[href*="/p/"]'), link => link.href)).size;
+
+const settle = () => new Promise(resolve => {
+    const linksBefore = document.querySelectorAll('a[href*="/p/"]').length;
+    const done = () => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve();
+    };
+    const observer = new MutationObserver(() => {
+        if (document.querySelectorAll('a[href*="/p/"]').length > linksBefore) return done();
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(done, quietMs);
+    });
+    let quietTimer = setTimeout(done, quietMs);
+    const capTimer = setTimeout(done, quietMs * 4);
+    observer.observe(document.body, {childList: true, subtree: true});
+});
+
+return (async () => {
+    let scrolls = 0, links = countLinks(), unchanged = 0;
+    while (scrolls < maxScrolls && !(targetLinks && links >= targetLinks)) {
+        window.scrollTo(0, document.body.scrollHeight);
+        scrolls++;
+        await settle();
+        const newLinks = countLinks();
+        if (newLinks === links) {
+            if (++unchanged >= 2) break;
+        } else {
+            links = newLinks;
+            unchanged = 0;
+        }
+    }
+    return scrolls;
+})();
+"""
+
+# Finds the listing cards and reads everything the CSS selectors can give us in
+# a single round trip, instead of one WebDriver call per element and field
+_EXTRACT_LISTINGS_JS = r"""
+const [maxResults, listingSelectors, fieldSelectors] = arguments;
+
+// Text of the first element accepted by `accept`. Title and price check every
+// match of a selector, the other fields only the first one
+function findText(card, selectors, accept, firstOnly) {
+    for (const selector of selectors) {
+        const elements = firstOnly ? [card.querySelector(selector)] : card.querySelectorAll(selector);
+        for (const element of elements) {
+            const text = element ? element.innerText.trim() : '';
+            if (text && accept(text)) return text;
+        }
+    }
+    return null;
+}
+
+// Find the product links first, then walk up to the card container holding them
+const links = document.querySelectorAll('a[href*="/p/"]');
+let cards = [];
+if (links.length) {
+    const seenUrls = new Set();
+    for (const link of links) {
+        if (!link.href || seenUrls.has(link.href)) continue;
+        seenUrls.add(link.href);
+        // The card is a few levels up and has at least 3 lines of text
+        let node = link;
+        for (let level = 0; level < 5 && node.parentElement; level++) {
+            node = node.parentElement;
+            if (node.innerText && node.innerText.split('\n').length >= 3) {
+                if (!cards.includes(node)) cards.push(node);
+                break;
+            }
+        }
+        if (seenUrls.size >= maxResults) break;
+    }
+} else {
+    for (const selector of listingSelectors) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length) {
+            cards = Array.from(elements);
+            break;
+        }
+    }
+}
+
+return {
+    links: links.length,
+    listings: cards.slice(0, maxResults).map(card => {
+        const link = card.tagName === 'A' ? card : card.querySelector('a[href*="/p/"]');
+        // Prices are sometimes hidden from innerText, so also look in the HTML
+        const htmlPrice = card.innerHTML.match(/(?:S\$|SGD|\\u0024)\s*[\d,]+(?:\.\d{2})?/);
+        return {
+            tag: card.tagName.toLowerCase(),
+            url: link ? link.href : null,
+            text: card.innerText || '',
+            html_price: htmlPrice ? htmlPrice[0] : null,
+            title: findText(card, fieldSelectors.title,
+                            t => t.length > 15 && !t.includes('$') && !t.toLowerCase().includes('ago'), false),
+            price: findText(card, fieldSelectors.price, t => t.includes('$'), false),
+            seller: findText(card, fieldSelectors.seller, t => true, true),
+            time: findText(card, fieldSelectors.time, t => /ago|hour|minute|day|week|month|year/i.test(t), true),
+            condition: findText(card, fieldSelectors.condition, t => true, true),
+        };
+    }),
+};
+"""
+
+
+@lru_cache(maxsize=1)
+def detect_browser() -> Optional[str]:
+    """Detect which browser is available on the system (checked once per process)"""
+    import platform
+
+    # Check for Chrome/Chromium
+    chrome_commands = ['google-chrome', 'chrome', 'chromium', 'chromium-browser']
+    chrome_paths_windows = [
+        r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+        r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+        os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
+    ]
+
+    # Try command-line detection first (works on Linux/Mac)
+    for cmd in chrome_commands:
+        if shutil.which(cmd):
+            logger.info("Detected Chrome browser: %s", cmd)
+            return 'chrome'
+
+    # On Windows, check specific paths
+    if platform.system() == 'Windows':
+        for chrome_path in chrome_paths_windows:
+            if Path(chrome_path).exists():
+                logger.info("Detected Chrome browser at: %s", chrome_path)
+                return 'chrome'
+
+    # Check for Firefox
+    firefox_paths_windows = [
+        r'C:\Program Files\Mozilla Firefox\firefox.exe',
+        r'C:\Program Files (x86)\Mozilla Firefox\firefox.exe',
+    ]
+
+    if shutil.which('firefox'):
+        logger.info("Detected Firefox browser")
+        return 'firefox'
+
+    if platform.system() == 'Windows':
+        for firefox_path in firefox_paths_windows:
+            if Path(firefox_path).exists():
+                logger.info("Detected Firefox at: %s", firefox_path)
+                return 'firefox'
+
+    return None
+
+
+@lru_cache(maxsize=1)
+def _find_chrome_binary() -> Optional[str]:
+    """Find the Chrome/Chromium binary to launch (checked once per process)"""
+    import platform
+
+    if platform.system() == 'Windows':
+        # Windows Chrome paths
+        chrome_paths = [
+            r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+            os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
+        ]
+        for path in chrome_paths:
+            if Path(path).exists():
+                logger.info("Found Chrome at: %s", path)
+                return path
+    else:
+        # Linux/Mac paths
+        chromium_paths = [
+            '/usr/bin/chromium-browser',
+            '/usr/bin/chromium',
+            '/snap/bin/chromium',
+            '/usr/bin/google-chrome',
+            '/usr/bin/chrome',
+        ]
+        for path in chromium_paths:
+            if shutil.which(path) or Path(path).exists():
+                logger.info("Found browser at: %s", path)
+                return path
+
+    return None
+
+
+def _try_lock(handle) -> bool:
+    """Take a non-blocking exclusive lock on an open file"""
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(handle):
+    """Release a lock taken by _try_lock and close the file"""
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(handle, fcntl.LOCK_UN)
+    except OSError:
+        pass
+    finally:
+        handle.close()
+
+
+def _profile_in_use(profile_dir: Path) -> bool:
+    """
+    Whether a Chrome is still running on a profile directory
+
+    A Chrome left over from a killed scraper keeps its profile open even
+    though the slot lock was dropped. Chrome marks an open profile with a
+    SingletonLock symlink to "<host>-<pid>" ("lockfile" on Windows). Marks
+    left by a Chrome that is no longer running are removed, so the next
+    launch on the profile doesn't fail.
+    """
+    if os.name == 'nt':
+        try:
+            (profile_dir / "lockfile").unlink()
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # Windows won't delete the file while a running Chrome holds it
+            return True
+        return False
+
+    try:
+        target = os.readlink(profile_dir / "SingletonLock")
+    except FileNotFoundError:
+        return False
+    except OSError:
+        target = ''
+
+    host, _, pid = target.rpartition('-')
+    if host and host != socket.gethostname():
+        # Chrome refuses a profile that another machine has open
+        return True
+    if pid.isdigit():
+        try:
+            os.kill(int(pid), 0)
+            return True
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            # Running, but as another user
+            return True
+
+    for name in ("SingletonLock", "SingletonCookie", "SingletonSocket"):
+        try:
+            (profile_dir / name).unlink()
+        except OSError:
+            pass
+    return False
+
+
+def _prune_profile_slots():
+    """Delete unused slots at or above MAX_PROFILE_SLOTS left by earlier runs"""
+    for lock_path in _PROFILE_ROOT.glob("slot_*.lock"):
+        slot = lock_path.stem[len("slot_"):]
+        if not slot.isdigit() or int(slot) < MAX_PROFILE_SLOTS:
+            continue
+        handle = open(lock_path, 'a+')
+        if not _try_lock(handle):
+            handle.close()
+            continue
+        try:
+            profile_dir = _PROFILE_ROOT / f"slot_{slot}"
+            if not _profile_in_use(profile_dir):
+                shutil.rmtree(profile_dir, ignore_errors=True)
+                lock_path.unlink()
+        except OSError:
+            pass
+        finally:
+            _unlock(handle)
+
+
+def _claim_profile_dir():
+    """
+    Claim the first persistent profile slot no other scraper is using
+
+    The slot stays claimed while the returned lock file is open. The operating
+    system drops the lock when the process exits, and slots still held open
+    by a Chrome that outlived its scraper are skipped. When all
+    MAX_PROFILE_SLOTS slots are busy, a temporary profile is returned instead.
+
+    Returns:
+        Tuple of (profile directory, open lock file or None for a temporary
+        profile)
+    """
+    _PROFILE_ROOT.mkdir(parents=True, exist_ok=True)
+    with _profile_slots_lock:
+        _prune_profile_slots()
+        for slot in range(MAX_PROFILE_SLOTS):
+            handle = open(_PROFILE_ROOT / f"slot_{slot}.lock", 'a+')
+            if _try_lock(handle):
+                profile_dir = _PROFILE_ROOT / f"slot_{slot}"
+                if not _profile_in_use(profile_dir):
+                    return str(profile_dir), handle
+                _unlock(handle)
+            else:
+                handle.close()
+
+    logger.warning("All %d profile slots are in use, using a temporary profile", MAX_PROFILE_SLOTS)
+    return tempfile.mkdtemp(prefix="carousell-chrome-"), None
+
+
+def _pick_title(lines: List[str], lines_lower: List[str]) -> Optional[str]:
+    """
+    Item name from a card's text lines
+
+    Structure: [0]=seller, [1]=time, [2]=ITEM_NAME or "Buyer Protection", [3]=ITEM_NAME if [2] was badge
+    """
+    # Find the time line first
+    time_line_idx = -1
+    for i, line_lower in enumerate(lines_lower):
+        if 'ago' in line_lower or 'just now' in line_lower:
+            time_line_idx = i
+            break
+
+    # Item name is the line AFTER the time
+    if time_line_idx < 0 or time_line_idx + 1 >= len(lines):
+        return None
+    potential_title = lines[time_line_idx + 1]
+
+    # Skip Carousell badges/features like "Buyer Protection"; the real item
+    # name is in the NEXT line
+    if lines_lower[time_line_idx + 1] in _BADGES and time_line_idx + 2 < len(lines):
+        potential_title = lines[time_line_idx + 2]
+
+    # Accept it as long as it's not obviously a price
+    return potential_title if '$' not in potential_title else None
+
+
+def _pick_price(text: str, text_lower: str) -> Optional[str]:
+    """Price from a card's visible text, or 'Make Offer' if it has none"""
+    price_match = _PRICE_RE.search(text)
+    if price_match:
+        return price_match.group()
+    if 'make offer' in text_lower or 'make an offer' in text_lower:
+        return 'Make Offer'
+    return None
+
+
+def _pick_seller(lines: List[str], lines_lower: List[str]) -> Optional[str]:
+    """Seller from a card's text lines: an @username, or the line before the time"""
+    for idx_line, line in enumerate(lines):
+        # Look for @username
+        if line.startswith('@'):
+            return line
+        # Look for username near time indicators; previous line might be seller
+        if idx_line > 0 and any(x in lines_lower[idx_line] for x in _TIME_KEYWORDS):
+            potential_seller = lines[idx_line - 1]
+            if '$' not in potential_seller and len(potential_seller) < 50:
+                return potential_seller
+    return None
+
+
+def _pick_time(text: str, lines: List[str], lines_lower: List[str]) -> Optional[str]:
+    """Posting time from a card's text, e.g. '2 hours ago'"""
+    time_match = _TIME_RE.search(text)
+    if time_match:
+        return time_match.group()
+    # Look for lines containing time indicators
+    for line, line_lower in zip(lines, lines_lower):
+        if 'ago' in line_lower:
+            return line
+    return None
+
+
+def _pick_condition(lines: List[str], lines_lower: List[str]) -> Optional[str]:
+    """
+    Condition from a card's text lines
+
+    Takes a short line that STARTS with a condition keyword, so keywords
+    embedded in a title don't count. Keywords earlier in _CONDITION_KEYWORDS
+    win over later ones, wherever their lines are on the card.
+    """
+    # One startswith pass over the tuple narrows the lines down to candidates
+    candidates = [
+        (line, line_lower) for line, line_lower in zip(lines, lines_lower)
+        if len(line) < 50 and line_lower.startswith(_CONDITION_KEYWORDS)
+    ]
+    if len(candidates) <= 1:
+        return candidates[0][0] if candidates else None
+
+    for keyword in _CONDITION_KEYWORDS:
+        for line, line_lower in candidates:
+            if line_lower.startswith(keyword):
+                return line
+    return None
+
+
+def _extract_fields(listing: Dict[str, Optional[str]], base_url: str) -> Dict[str, str]:
+    """
+    Build an item from one card returned by _EXTRACT_LISTINGS_JS
+
+    The CSS selector matches found in the page are used where present and
+    the card's text is parsed for the rest. Missing fields are 'N/A'.
+    """
+    text = listing['text']
+    # Split the text into lines once; every text fallback reads these
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    lines_lower = [line.lower() for line in lines]
+
+    url = listing['url']
+    if url and not url.startswith('http'):
+        url = base_url + url
+
+    # Prices are sometimes hidden from the visible text, so the innerHTML match goes first
+    price = listing['html_price']
+    if price:
+        price = price.replace('\\u0024', '$').replace('SGD', 'S$')
+
+    item_data = {
+        'url': url,
+        'item_name': _pick_title(lines, lines_lower) or listing['title'],
+        'price': price or listing['price'] or _pick_price(text, text.lower()),
+        'seller': listing['seller'] or _pick_seller(lines, lines_lower),
+        'time': listing['time'] or _pick_time(text, lines, lines_lower),
+        'condition': listing['condition'] or _pick_condition(lines, lines_lower),
+    }
+    return {field: value or 'N/A' for field, value in item_data.items()}
+
+
+class SearchCache:
+    """
+    On-disk cache of search results, so repeated searches skip the browser
+
+    Results are stored in a SQLite file keyed by the normalized search term,
+    max_results and the current day, and expire after `ttl` seconds.
+    """
+
+    def __init__(self, path: str = ".carousell_cache.sqlite3", ttl: int = 3600):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file to store results in
+            ttl: Seconds after which cached results expire
+        """
+        self.path = str(path)
+        self.ttl = ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, data TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per call keeps the cache usable from pool worker threads.
+        # Callers wrap it in closing(): the connection's own context manager
+        # only commits or rolls back, it never closes
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def _key(query: str, max_results: int) -> str:
+        normalized = ' '.join(query.lower().split())
+        return f"{normalized}|{max_results}|{date.today().isoformat()}"
+
+    def get(self, query: str, max_results: int) -> Optional[List[Dict[str, str]]]:
+        """Return the cached results for a search, or None if there are none"""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT data FROM results WHERE key = ? AND expires > ?",
+                (self._key(query, max_results), time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, query: str, max_results: int, results: List[Dict[str, str]]):
+        """Store the results of a search"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM results WHERE expires <= ?", (time.time(),))
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, expires, data) VALUES (?, ?, ?)",
+                (self._key(query, max_results), time.time() + self.ttl, json.dumps(results)),
+            )
+
+
 class CarousellScraper:
     """Scraper for Carousell.sg marketplace"""
 
-    def __init__(self, headless: bool = True, delay_range: tuple = (2, 5), browser: Optional[str] = None):
+    def __init__(self, headless: bool = True, delay_range: tuple = (2, 5), browser: Optional[str] = None,
+                 browser_args: Optional[List[str]] = None, profile_dir: Optional[str] = None,
+                 cache: Optional[SearchCache] = None):
         """
         Initialize the scraper
 
@@ -27,61 +614,27 @@ class CarousellScraper:
             headless: Run browser in headless mode
             delay_range: Tuple of (min, max) seconds for random delays
             browser: Browser to use ('chrome', 'firefox', or None for auto-detect)
+            browser_args: Extra Chrome command-line flags, e.g. FAST_BROWSER_ARGS
+            profile_dir: Chrome user data directory (default: a free slot in
+                ~/.cache/carousell-scraper/chrome, kept between runs)
+            cache: Optional SearchCache to reuse results of repeated searches
         """
         self.headless = headless
         self.delay_range = delay_range
         self.base_url = "https://www.carousell.sg"
         self.driver = None
         self.browser = browser
+        self.browser_args = list(browser_args or [])
+        self.profile_dir = str(profile_dir) if profile_dir else None
+        self._profile_lock = None  # Lock file holding our profile slot
+        self._temp_profile = False  # profile_dir is a throwaway we delete on release
+        self.cache = cache
         self.debug_screenshot = None  # Store screenshot bytes for debugging
 
-    def _detect_browser(self) -> Optional[str]:
-        """Detect which browser is available on the system"""
-        import platform
-
-        # Check for Chrome/Chromium
-        chrome_commands = ['google-chrome', 'chrome', 'chromium', 'chromium-browser']
-        chrome_paths_windows = [
-            r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-            r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
-            os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
-        ]
-
-        # Try command-line detection first (works on Linux/Mac)
-        for cmd in chrome_commands:
-            if shutil.which(cmd):
-                print(f"Detected Chrome browser: {cmd}")
-                return 'chrome'
-
-        # On Windows, check specific paths
-        if platform.system() == 'Windows':
-            for chrome_path in chrome_paths_windows:
-                if Path(chrome_path).exists():
-                    print(f"Detected Chrome browser at: {chrome_path}")
-                    return 'chrome'
-
-        # Check for Firefox
-        firefox_paths_windows = [
-            r'C:\Program Files\Mozilla Firefox\firefox.exe',
-            r'C:\Program Files (x86)\Mozilla Firefox\firefox.exe',
-        ]
-
-        if shutil.which('firefox'):
-            print(f"Detected Firefox browser")
-            return 'firefox'
-
-        if platform.system() == 'Windows':
-            for firefox_path in firefox_paths_windows:
-                if Path(firefox_path).exists():
-                    print(f"Detected Firefox at: {firefox_path}")
-                    return 'firefox'
-
-        return None
-
     def _setup_driver(self):
         """Setup browser driver with appropriate options"""
         # Determine which browser to use
-        browser = self.browser or self._detect_browser()
+        browser = self.browser or detect_browser()
 
         if not browser:
             import platform
@@ -110,13 +663,12 @@ class CarousellScraper:
     def _setup_chrome(self):
         """Setup Chrome/Chromium driver"""
         from selenium.webdriver.chrome.options import Options
-        import tempfile
 
-        print("Setting up Chrome driver...")
+        logger.info("Setting up Chrome driver...")
         chrome_options = Options()
 
         if self.headless:
-            print("⚠️  Warning: Headless mode may trigger CAPTCHA. Consider disabling it for better results.")
+            logger.warning("Headless mode may trigger CAPTCHA. Consider disabling it for better results.")
             chrome_options.add_argument("--headless=new")
 
         # Essential options for WSL2 compatibility
@@ -124,13 +676,12 @@ class CarousellScraper:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
 
-        # Fix for DevToolsActivePort error - use unique port
-        debug_port = random.randint(9000, 9999)
-        chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
-
-        # Create temporary user data directory to avoid conflicts
-        user_data_dir = tempfile.mkdtemp(prefix="chrome_profile_")
-        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+        # Own user data directory to avoid conflicts, reused across restarts and runs
+        if self.profile_dir is None:
+            self.profile_dir, self._profile_lock = _claim_profile_dir()
+            self._temp_profile = self._profile_lock is None
+        os.makedirs(self.profile_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
 
         # Minimal additional flags for stability
         chrome_options.add_argument("--disable-extensions")
@@ -140,586 +691,479 @@ class CarousellScraper:
         # Suppress unnecessary logging
         chrome_options.add_argument("--log-level=3")
 
-        # Set page load strategy to 'eager' for faster loading
-        chrome_options.page_load_strategy = 'eager'
+        # Turn off subsystems a text scraper doesn't need
+        for arg in LEAN_CHROME_ARGS:
+            chrome_options.add_argument(arg)
+
+        # Extra flags go last so they override the defaults above
+        for arg in self.browser_args:
+            chrome_options.add_argument(arg)
+
+        # Don't download images (also covers requests the URL block list misses)
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+        # Don't block on page loads; searches navigate through _navigate() and
+        # then wait explicitly for the listings they need
+        chrome_options.page_load_strategy = 'none'
 
         # Try to find Chrome/Chromium binary
-        import platform
-
-        if platform.system() == 'Windows':
-            # Windows Chrome paths
-            chrome_paths = [
-                r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-                r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
-                os.path.expanduser(r'~\AppData\Local\Google\Chrome\Application\chrome.exe'),
-            ]
-            for path in chrome_paths:
-                if Path(path).exists():
-                    print(f"Found Chrome at: {path}")
-                    chrome_options.binary_location = path
-                    break
-        else:
-            # Linux/Mac paths
-            chromium_paths = [
-                '/usr/bin/chromium-browser',
-                '/usr/bin/chromium',
-                '/snap/bin/chromium',
-                '/usr/bin/google-chrome',
-                '/usr/bin/chrome',
-            ]
-            for path in chromium_paths:
-                if shutil.which(path) or Path(path).exists():
-                    print(f"Found browser at: {path}")
-                    chrome_options.binary_location = path
-                    break
+        binary_location = _find_chrome_binary()
+        if binary_location:
+            chrome_options.binary_location = binary_location
 
-        print(f"Initializing ChromeDriver (debug port {debug_port})...")
+        logger.info("Initializing ChromeDriver...")
         if not self.headless:
-            print("Running in visible mode - browser window will open")
+            logger.info("Running in visible mode - browser window will open")
 
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # keep_alive reuses one HTTP connection for all driver commands
+            self.driver = webdriver.Chrome(options=chrome_options, keep_alive=True)
         except Exception as e:
-            print(f"Error initializing ChromeDriver: {e}")
-            print("\nTroubleshooting:")
-            print("1. Make sure Chromium is installed: sudo apt install chromium-browser")
-            print("2. Or try Firefox: sudo apt install firefox")
+            logger.error("Error initializing ChromeDriver: %s\n"
+                         "Troubleshooting:\n"
+                         "1. Make sure Chromium is installed: sudo apt install chromium-browser\n"
+                         "2. Or try Firefox: sudo apt install firefox", e)
             raise
 
         # Set timeouts to prevent hanging
         self.driver.set_page_load_timeout(30)
-        self.driver.implicitly_wait(3)
+        # No implicit wait: every wait is explicit, and lookups that find
+        # nothing return immediately instead of polling
+        self.driver.implicitly_wait(0)
+
+        self._block_requests()
+
+        logger.info("Chrome driver setup complete")
+
+    def _block_requests(self):
+        """
+        Block heavy and tracking requests in the current tab
 
-        print("✓ Chrome driver setup complete!")
+        Blocking is a DevTools protocol setting of each tab, so every new tab
+        needs this call too. Does nothing on browsers without the protocol.
+        """
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning("Could not enable request blocking: %s", e)
 
     def _setup_firefox(self):
         """Setup Firefox driver"""
         try:
             from selenium.webdriver.firefox.options import Options
 
-            print("Setting up Firefox driver...")
+            logger.info("Setting up Firefox driver...")
             firefox_options = Options()
 
             if self.headless:
                 firefox_options.add_argument("--headless")
 
             # Use Selenium Manager to auto-download GeckoDriver
-            self.driver = webdriver.Firefox(options=firefox_options)
+            self.driver = webdriver.Firefox(options=firefox_options, keep_alive=True)
 
             # Set timeouts
             self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(3)
+            self.driver.implicitly_wait(0)
 
-            print("Firefox driver setup complete!")
+            logger.info("Firefox driver setup complete")
 
         except Exception as e:
             raise RuntimeError(f"Failed to setup Firefox driver: {e}")
 
+    def warm_up(self):
+        """
+        Start the browser and open the Carousell home page
+
+        This opens the connection to Carousell and fills the browser's HTTP
+        cache with the site's scripts and styles ahead of the first search.
+        """
+        if self.driver is None:
+            self._setup_driver()
+
+        logger.info("Warming up browser on %s...", self.base_url)
+        try:
+            self.driver.get(self.base_url)
+            # Let the page finish loading so its assets end up in the cache
+            WebDriverWait(self.driver, 30).until(
+                lambda driver: driver.execute_script("return document.readyState") == 'complete'
+            )
+        except TimeoutException:
+            logger.warning("Warm-up page load timeout - continuing anyway...")
+        except Exception as e:
+            logger.warning("Could not warm up browser: %s", e)
+
+    def _evaluate(self, script: str, *args, timeout: Optional[float] = None):
+        """
+        Run a script in the current page and return its result as plain data
+
+        On Chrome the script goes straight to the DevTools protocol's
+        Runtime.evaluate and the result comes back as JSON by value. Other
+        browsers use execute_script. Either way the script reads its inputs
+        from `arguments` and may return a Promise, which is awaited.
+
+        `timeout` sets the WebDriver script timeout for execute_script.
+        Runtime.evaluate ignores that timeout, so scripts run on Chrome have
+        to bound their own waits.
+        """
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            expression = f"(function () {{\n{script}\n}}).apply(null, {json.dumps(args)})"
+            response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': expression,
+                'returnByValue': True,
+                'awaitPromise': True,
+            })
+            if 'exceptionDetails' in response:
+                details = response['exceptionDetails']
+                message = details.get('exception', {}).get('description') or details.get('text')
+                raise RuntimeError(f"Page script failed: {message}")
+            return response['result'].get('value')
+
+        if timeout is not None:
+            self.driver.set_script_timeout(timeout)
+        return self.driver.execute_script(script, *args)
+
+    def _navigate(self, url: str):
+        """
+        Start loading a page in the current tab
+
+        On Chrome the navigation goes through the DevTools protocol, which
+        returns as soon as the new document is committed instead of waiting for
+        it to load. The old page is gone by then, so callers can immediately
+        wait for the elements they need. Other browsers use driver.get().
+        """
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            result = self.driver.execute_cdp_cmd('Page.navigate', {'url': url})
+            if result.get('errorText'):
+                raise RuntimeError(f"Could not load {url}: {result['errorText']}")
+        else:
+            self.driver.get(url)
+
     def _random_delay(self):
         """Add random delay to mimic human behavior"""
         delay = random.uniform(self.delay_range[0], self.delay_range[1])
-        print(f"Waiting {delay:.2f} seconds...")
+        logger.info("Waiting %.2f seconds...", delay)
         time.sleep(delay)
 
-    def _scroll_page(self, scrolls: int = 3, delay: tuple = (0.5, 1.0)):
+    def _capture_debug_screenshot(self) -> bytes:
+        """
+        Capture the current page as image bytes for debugging
+
+        Chrome captures a 60% quality JPEG through the DevTools protocol, which
+        is several times smaller than a PNG. Other browsers fall back to PNG.
+        """
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            try:
+                screenshot = self.driver.execute_cdp_cmd(
+                    'Page.captureScreenshot', {'format': 'jpeg', 'quality': 60}
+                )
+                return base64.b64decode(screenshot['data'])
+            except Exception as e:
+                logger.warning("Could not capture JPEG screenshot, using PNG: %s", e)
+
+        return self.driver.get_screenshot_as_png()
+
+    def _scroll_page(self, scrolls: int = 3, settle_time: float = 0.5, target_links: Optional[int] = None):
         """
         Scroll the page to load more content
 
+        The scrolling runs inside the page in a single script call. After each
+        scroll it waits until the DOM has stopped changing, and it stops early
+        once enough listings are loaded or scrolling no longer adds any.
+
         Args:
-            scrolls: Number of times to scroll
-            delay: Tuple of (min, max) seconds to wait between scrolls
+            scrolls: Maximum number of times to scroll
+            settle_time: Seconds without DOM changes that count as settled
+            target_links: Stop once this many product links are on the page
+        """
+        # The script caps each settle wait at four times settle_time, which is
+        # what bounds it on Chrome; execute_script also gets a timeout to match
+        done = self._evaluate(_SCROLL_UNTIL_STABLE_JS, scrolls, int(settle_time * 1000),
+                              target_links or 0, timeout=scrolls * settle_time * 4 + 5)
+        logger.info("Scrolled %s/%d times", done, scrolls)
+
+    def _search_url(self, query: str) -> str:
+        """Build the search results URL for a query"""
+        return f"{self.base_url}/search/{query.replace(' ', '%20')}"
+
+    def _scrape_current_page(self, max_results: int) -> List[Dict[str, str]]:
         """
-        for i in range(scrolls):
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(delay[0], delay[1]))
-            print(f"Scrolled {i+1}/{scrolls} times")
+        Scroll the search results page in the current tab and extract its listings
 
-    def search(self, query: str, max_results: int = 20) -> List[Dict[str, str]]:
+        Args:
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of dictionaries containing item information
+        """
+        results = []
+
+        # Wait for the first listings instead of sleeping a fixed time
+        logger.info("Waiting for listings to load...")
+        try:
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'article, a[href*="/p/"]'))
+            )
+            logger.info("Listings found")
+        except TimeoutException:
+            logger.warning("Timeout waiting for listings - continuing anyway...")
+
+        # Always scroll to load more items (Carousell uses lazy loading)
+        logger.info("Scrolling to load all items...")
+        # Calculate scrolls based on max_results (each row typically has 4 items)
+        num_scrolls = max(2, (max_results // 4) + 1)
+        self._scroll_page(scrolls=num_scrolls, target_links=max_results)
+
+        # Find the listing cards and read their fields in one script call
+        logger.info("Searching for product listings on page...")
+        page_data = self._evaluate(
+            _EXTRACT_LISTINGS_JS, max_results, LISTING_SELECTORS, FIELD_SELECTORS
+        )
+        all_listings = page_data['listings']
+        logger.info("Found %d product links, %d unique listing cards",
+                    page_data['links'], len(all_listings))
+
+        if not all_listings:
+            logger.warning("Could not find any product listings. The page structure may have changed.")
+            # Save screenshot for debugging
+            try:
+                self.debug_screenshot = self._capture_debug_screenshot()
+                logger.warning("Saved debug screenshot in memory (URL: %s, title: %s)",
+                               self.driver.current_url, self.driver.title)
+            except Exception as e:
+                logger.warning("Could not capture screenshot: %s", e)
+            return results
+
+        logger.info("Processing %d listings...", len(all_listings))
+
+        # Per-item diagnostics are only formatted when debug logging is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Two product links can lead up to the same card, so keep one item per URL
+        seen_urls = set()
+
+        # Fill in each listing from its text where the selectors found nothing
+        for idx, listing in enumerate(all_listings):
+            if len(results) >= max_results:
+                break
+
+            # Debug: Log raw listing text for items 3-6 (4th-7th items)
+            if debug and 3 <= idx <= 6:
+                line_breakdown = '\n'.join(
+                    f"  [{i}]: '{line.strip()}'"
+                    for i, line in enumerate(listing['text'].split('\n')) if line.strip()
+                )
+                logger.debug("Listing %d (Item #%d), tag %s:\n%s\nLine breakdown:\n%s",
+                             idx, idx + 1, listing['tag'], listing['text'], line_breakdown)
+
+            item_data = _extract_fields(listing, self.base_url)
+
+            if item_data['url'] != 'N/A':
+                if item_data['url'] in seen_urls:
+                    continue
+                seen_urls.add(item_data['url'])
+
+            # Only add if we have at least a URL or item_name
+            if item_data['url'] != 'N/A' or item_data['item_name'] != 'N/A':
+                results.append(item_data)
+                if debug:
+                    logger.debug("Extracted item %d: %s\n  URL: %s\n  Price: %s, Seller: %s, Time: %s, Condition: %s",
+                                 len(results), item_data['item_name'][:50], item_data['url'][:80],
+                                 item_data['price'], item_data['seller'], item_data['time'],
+                                 item_data['condition'])
+
+        logger.info("Successfully extracted %d items", len(results))
+
+        return results
+
+    def search(self, query: str, max_results: int = 20, use_cache: bool = True) -> List[Dict[str, str]]:
         """
         Search for items on Carousell
 
         Args:
             query: Search term
             max_results: Maximum number of results to return
+            use_cache: Look the search up in the scraper's cache first, if it has one
 
         Returns:
             List of dictionaries containing item information
         """
+        if self.cache is not None and use_cache:
+            cached = self.cache.get(query, max_results)
+            if cached is not None:
+                logger.info("Using cached results for %r", query)
+                return cached
+
         results = []
 
         try:
             # Setup driver if not already done
             if self.driver is None:
-                print("Setting up Chrome driver...")
+                logger.info("Setting up Chrome driver...")
                 self._setup_driver()
 
-            # Build search URL
-            search_url = f"{self.base_url}/search/{query.replace(' ', '%20')}"
-            print(f"Navigating to: {search_url}")
+            search_url = self._search_url(query)
+            logger.info("Navigating to: %s", search_url)
 
             try:
-                self.driver.get(search_url)
-                print("Page loaded successfully")
+                self._navigate(search_url)
+                logger.info("Page is loading")
             except TimeoutException:
-                print("Page load timeout - continuing anyway...")
+                logger.warning("Page load timeout - continuing anyway...")
             except Exception as e:
-                print(f"Error loading page: {e}")
+                logger.error("Error loading page: %s", e)
                 raise
 
-            print("Waiting for page to settle...")
-            time.sleep(1.5)  # Give more time for initial content to load
+            results = self._scrape_current_page(max_results)
 
-            # Check if page actually loaded
-            try:
-                page_title = self.driver.title
-                print(f"Page title: {page_title}")
-            except:
-                print("Could not get page title")
-
-            # Always scroll to load more items (Carousell uses lazy loading)
-            print("Scrolling to load all items...")
-            # Calculate scrolls based on max_results (each row typically has 4 items)
-            num_scrolls = max(2, (max_results // 4) + 1)
-            self._scroll_page(scrolls=num_scrolls)
-
-            # Extra wait for lazy-loaded content
-            print("Waiting for lazy-loaded content...")
-            time.sleep(1)
-
-            # Wait for listings to load
-            print("Waiting for page content to load...")
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                print("Body element found")
-            except TimeoutException:
-                print("Timeout waiting for page body to load")
-                return results
-
-            # Try different selectors to find product listings
-            # Carousell's structure may vary, so we'll try multiple approaches
-            print("Searching for product listings on page...")
-
-            # Approach: Find the product links first, then get their grandparent containers
-            # Carousell wraps each listing in a container that has the link nested inside
-            print("Looking for product links...")
-            product_links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/p/"]')
-            print(f"Found {len(product_links)} product links")
-
-            if not product_links:
-                # Fallback to generic selectors
-                listing_selectors = [
-                    'article',
-                    '[data-testid*="listing-card"]',
-                    '[class*="ProductCard"]',
-                    '[class*="ListingCard"]',
-                ]
-                for selector in listing_selectors:
-                    try:
-                        print(f"Trying fallback selector: {selector}")
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            print(f"✓ Found {len(elements)} elements with selector: {selector}")
-                            all_listings = elements
-                            break
-                    except Exception as e:
-                        print(f"  Error with selector {selector}: {e}")
-                        continue
+        except Exception as e:
+            logger.error("Error during scraping: %s", e)
+
+        # Empty results are not cached, they are often a CAPTCHA page
+        if results and self.cache is not None:
+            self.cache.set(query, max_results, results)
+
+        return results
+
+    def search_many(self, queries: List[str], max_results: int = 20,
+                    use_cache: bool = True) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Search for several terms at once in one browser, one tab per term
+
+        All tabs are opened up front so their pages load in parallel, then each
+        tab is scrolled, extracted and closed in turn. This avoids starting a
+        browser per search term. Terms found in the cache don't get a tab.
+
+        Args:
+            queries: Search terms
+            max_results: Maximum number of results per search term
+            use_cache: Look each search up in the scraper's cache first, if it has one
+
+        Returns:
+            Dictionary mapping each search term to its list of results
+        """
+        queries = list(dict.fromkeys(queries))
+        results = {query: [] for query in queries}
+
+        pending = []
+        for query in queries:
+            cached = None
+            if self.cache is not None and use_cache:
+                cached = self.cache.get(query, max_results)
+            if cached is not None:
+                logger.info("Using cached results for %r", query)
+                results[query] = cached
             else:
-                # Get the card containers (usually 2-3 levels up from the link)
-                print("Extracting unique listing card containers...")
-                unique_cards = []
-                seen_urls = set()
-
-                # Process only unique links first (faster)
-                unique_links = []
-                for link in product_links:
-                    try:
-                        url = link.get_attribute('href')
-                        if url and url not in seen_urls:
-                            seen_urls.add(url)
-                            unique_links.append(link)
-                            # Stop early if we have enough
-                            if len(unique_links) >= max_results:
-                                break
-                    except:
-                        continue
-
-                print(f"Found {len(unique_links)} unique product links, extracting containers...")
-
-                # Now extract containers only for unique links
-                for idx, link in enumerate(unique_links):
-                    try:
-                        # Try to find the card container by going up the DOM tree
-                        # The card is usually a div that contains all listing info
-                        current = link
-                        card = None
-
-                        # Go up max 5 levels to find a suitable container
-                        for _ in range(5):
-                            try:
-                                current = current.find_element(By.XPATH, './..')
-                                # Check if this element looks like a card (has substantial text)
-                                text = current.text
-                                if text and len(text.split('\n')) >= 3:
-                                    card = current
-                                    break
-                            except:
-                                break
-
-                        if card:
-                            unique_cards.append(card)
-
-                        # Progress indicator for large scrapes
-                        if idx > 0 and idx % 10 == 0:
-                            print(f"  Processed {idx}/{len(unique_links)} containers...")
-                    except:
-                        continue
-
-                all_listings = unique_cards
-                print(f"✓ Extracted {len(all_listings)} unique listing cards")
-
-            if not all_listings:
-                print("Could not find any product listings. The page structure may have changed.")
-                # Save screenshot for debugging
-                try:
-                    self.debug_screenshot = self.driver.get_screenshot_as_png()
-                    print(f"Saved debug screenshot in memory")
-                    print(f"Current URL: {self.driver.current_url}")
-                    print(f"Page title: {self.driver.title}")
-                except Exception as e:
-                    print(f"Could not capture screenshot: {e}")
-                return results
+                pending.append(query)
+        if not pending:
+            return results
 
-            print(f"Processing {min(len(all_listings), max_results)} listings...")
+        main_window = None
+        try:
+            if self.driver is None:
+                self._setup_driver()
 
-            # Temporarily disable implicit wait for faster extraction
-            self.driver.implicitly_wait(0)
+            main_window = self.driver.current_window_handle
 
+            # Each tab gets request blocking before its page starts loading.
+            # Setting location returns immediately, so all pages load at the same time
+            tabs = {}
+            for query in pending:
+                logger.info("Opening tab for: %s", query)
+                self.driver.switch_to.new_window('tab')
+                tabs[self.driver.current_window_handle] = query
+                self._block_requests()
+                self.driver.execute_script("window.location.href = arguments[0];", self._search_url(query))
 
-            # Extract information from each listing
-            for idx, listing in enumerate(all_listings[:max_results]):
+            for handle, query in tabs.items():
+                self.driver.switch_to.window(handle)
                 try:
-                    item_data = {}
-
-                    # Get all text content for debugging
-                    listing_text = listing.text
-
-                    # Debug: Print raw listing text for items 3-6 (4th-7th items)
-                    if 3 <= idx <= 6:
-                        print(f"\n--- DEBUG Listing {idx} (Item #{idx+1}) ---")
-                        print(f"Tag: {listing.tag_name}")
-                        print(f"Text:\n{listing_text}")
-                        # Show individual lines for better debugging
-                        lines = listing_text.split('\n')
-                        print(f"Line breakdown ({len(lines)} lines):")
-                        for i, line in enumerate(lines):
-                            if line.strip():
-                                print(f"  [{i}]: '{line.strip()}'")
-                        print("---")
-
-                    # Try to extract the link (URL)
-                    try:
-                        # Look for link element
-                        if listing.tag_name == 'a':
-                            link_elem = listing
-                        else:
-                            links = listing.find_elements(By.CSS_SELECTOR, 'a[href*="/p/"]')
-                            link_elem = links[0] if links else None
-
-                        if link_elem:
-                            item_url = link_elem.get_attribute('href')
-                            if item_url and not item_url.startswith('http'):
-                                item_url = self.base_url + item_url
-                            item_data['url'] = item_url
-                        else:
-                            item_data['url'] = 'N/A'
-                    except:
-                        item_data['url'] = 'N/A'
-
-                    # Try to extract the title/name
-                    # Structure: [0]=seller, [1]=time, [2]=ITEM_NAME or "Buyer Protection", [3]=ITEM_NAME if [2] was badge
-                    try:
-                        title_text = None
-
-                        # Primary method: Parse from text structure
-                        if listing_text:
-                            lines = [line.strip() for line in listing_text.split('\n') if line.strip()]
-
-                            # Find the time line first
-                            time_line_idx = -1
-                            for i, line in enumerate(lines):
-                                if 'ago' in line.lower() or 'just now' in line.lower():
-                                    time_line_idx = i
-                                    break
-
-                            # Item name is the line AFTER the time
-                            if time_line_idx >= 0 and time_line_idx + 1 < len(lines):
-                                potential_title = lines[time_line_idx + 1]
-
-                                # Skip Carousell badges/features like "Buyer Protection"
-                                if potential_title.lower() in ['buyer protection', 'verified', 'featured']:
-                                    if idx < 10:  # Debug for first 10 items
-                                        print(f"  [Item {idx+1}] Detected '{potential_title}' badge, skipping to next line")
-                                    # Real item name is in the NEXT line
-                                    if time_line_idx + 2 < len(lines):
-                                        potential_title = lines[time_line_idx + 2]
-
-                                # Accept it as long as it's not obviously a price
-                                if potential_title and '$' not in potential_title:
-                                    title_text = potential_title
-
-                        # Fallback: Try CSS selectors only if text parsing failed
-                        if not title_text:
-                            title_selectors = [
-                                'h3', 'h4', 'h2',
-                                'p[class*="title"]',
-                                '[class*="Title"]',
-                                '[data-testid*="title"]',
-                            ]
-                            for sel in title_selectors:
-                                elems = listing.find_elements(By.CSS_SELECTOR, sel)
-                                if elems:
-                                    for elem in elems:
-                                        text = elem.text.strip()
-                                        # Must be substantial and not metadata
-                                        if (text and
-                                            len(text) > 15 and
-                                            '$' not in text and
-                                            'ago' not in text.lower()):
-                                            title_text = text
-                                            break
-                                    if title_text:
-                                        break
-
-                        item_data['item_name'] = title_text if title_text else 'N/A'
-                    except Exception as e:
-                        print(f"Error extracting name: {e}")
-                        item_data['item_name'] = 'N/A'
-
-                    # Try to extract the price
-                    try:
-                        import re
-                        price_text = None
-
-                        # Method 1: Try to find price in innerHTML (sometimes prices are hidden from .text)
-                        try:
-                            inner_html = listing.get_attribute('innerHTML')
-                            if inner_html:
-                                # Look for price patterns in HTML
-                                price_match = re.search(r'(?:S\$|SGD|\\u0024)\s*[\d,]+(?:\.\d{2})?', inner_html)
-                                if price_match:
-                                    price_text = price_match.group().replace('\\u0024', '$').replace('SGD', 'S$')
-                        except:
-                            pass
-
-                        # Method 2: Try CSS selectors
-                        if not price_text:
-                            price_selectors = [
-                                '[class*="price"]',
-                                '[class*="Price"]',
-                                '[data-testid*="price"]',
-                                'span:not([class*="time"])',  # Spans that aren't time
-                            ]
-
-                            for sel in price_selectors:
-                                elems = listing.find_elements(By.CSS_SELECTOR, sel)
-                                if elems:
-                                    for elem in elems:
-                                        text = elem.text.strip()
-                                        if text and '$' in text:
-                                            price_text = text
-                                            break
-                                    if price_text:
-                                        break
-
-                        # Method 3: Search visible text for price pattern
-                        if not price_text and listing_text:
-                            price_match = re.search(r'S?\$\s*[\d,]+(?:\.\d{2})?', listing_text)
-                            if price_match:
-                                price_text = price_match.group()
-
-                        # If still no price, it might be "Make Offer" or similar
-                        if not price_text:
-                            if 'make offer' in listing_text.lower() or 'make an offer' in listing_text.lower():
-                                price_text = 'Make Offer'
-
-                        item_data['price'] = price_text if price_text else 'N/A'
-                    except Exception as e:
-                        print(f"Error extracting price: {e}")
-                        item_data['price'] = 'N/A'
-
-                    # Try to extract seller name
-                    try:
-                        import re
-                        seller_name = None
-
-                        # Try CSS selectors
-                        seller_selectors = [
-                            '[class*="seller"]',
-                            '[class*="Seller"]',
-                            '[class*="username"]',
-                            '[class*="Username"]',
-                            '[data-testid*="seller"]',
-                            'a[href*="/u/"]',  # User profile links
-                        ]
-
-                        for sel in seller_selectors:
-                            elems = listing.find_elements(By.CSS_SELECTOR, sel)
-                            if elems:
-                                text = elems[0].text.strip()
-                                if text and len(text) > 0:
-                                    seller_name = text
-                                    break
-
-                        # Fallback: look for @username pattern or text near time
-                        if not seller_name and listing_text:
-                            lines = [line.strip() for line in listing_text.split('\n') if line.strip()]
-                            for line in lines:
-                                # Look for @username
-                                if line.startswith('@'):
-                                    seller_name = line
-                                    break
-                                # Look for username near time indicators
-                                if any(x in line.lower() for x in ['ago', 'hour', 'minute', 'day']):
-                                    # Previous line might be seller
-                                    idx_line = lines.index(line)
-                                    if idx_line > 0:
-                                        potential_seller = lines[idx_line - 1]
-                                        if '$' not in potential_seller and len(potential_seller) < 50:
-                                            seller_name = potential_seller
-                                            break
-
-                        item_data['seller'] = seller_name if seller_name else 'N/A'
-                    except Exception as e:
-                        print(f"Error extracting seller: {e}")
-                        item_data['seller'] = 'N/A'
-
-                    # Try to extract posting time
-                    try:
-                        import re
-                        time_text = None
-
-                        # Try CSS selectors
-                        time_selectors = [
-                            '[class*="time"]',
-                            '[class*="Time"]',
-                            '[class*="date"]',
-                            '[class*="Date"]',
-                            '[data-testid*="time"]',
-                        ]
-
-                        for sel in time_selectors:
-                            elems = listing.find_elements(By.CSS_SELECTOR, sel)
-                            if elems:
-                                text = elems[0].text.strip()
-                                if 'ago' in text.lower() or any(x in text.lower() for x in ['hour', 'minute', 'day', 'week', 'month', 'year']):
-                                    time_text = text
-                                    break
-
-                        # Fallback: search for time patterns in text
-                        if not time_text and listing_text:
-                            # Match patterns like "2 hours ago", "1 day ago", etc.
-                            time_match = re.search(r'\d+\s*(second|minute|hour|day|week|month|year)s?\s*ago', listing_text, re.IGNORECASE)
-                            if time_match:
-                                time_text = time_match.group()
-                            else:
-                                # Look for lines containing time indicators
-                                lines = [line.strip() for line in listing_text.split('\n') if line.strip()]
-                                for line in lines:
-                                    if 'ago' in line.lower():
-                                        time_text = line
-                                        break
-
-                        item_data['time'] = time_text if time_text else 'N/A'
-                    except Exception as e:
-                        print(f"Error extracting time: {e}")
-                        item_data['time'] = 'N/A'
-
-                    # Try to extract condition
-                    try:
-                        condition_text = None
-
-                        # Try CSS selectors
-                        condition_selectors = [
-                            '[class*="condition"]',
-                            '[class*="Condition"]',
-                            '[data-testid*="condition"]',
-                        ]
-
-                        for sel in condition_selectors:
-                            elems = listing.find_elements(By.CSS_SELECTOR, sel)
-                            if elems:
-                                text = elems[0].text.strip()
-                                if text:
-                                    condition_text = text
-                                    break
-
-                        # Fallback: search for condition keywords in text
-                        # Only match lines that START with the condition (not embedded in title)
-                        if not condition_text and listing_text:
-                            condition_keywords = [
-                                'brand new', 'like new', 'lightly used', 'mint',
-                                'well-maintained', 'heavily used', 'almost new',
-                                'excellent condition', 'good condition', 'fair condition'
-                            ]
-                            text_lower = listing_text.lower()
-                            for keyword in condition_keywords:
-                                if keyword in text_lower:
-                                    # Find lines that START with this keyword (to avoid matching titles)
-                                    lines = [line.strip() for line in listing_text.split('\n') if line.strip()]
-                                    for line in lines:
-                                        line_lower = line.lower()
-                                        # Check if line starts with keyword or is just the keyword
-                                        if line_lower.startswith(keyword) or line_lower == keyword:
-                                            # Make sure it's SHORT (not a title) and not "Buyer Protection"
-                                            if len(line) < 50 and line.lower() != 'buyer protection':
-                                                condition_text = line
-                                                break
-                                    if condition_text:
-                                        break
-
-                        item_data['condition'] = condition_text if condition_text else 'N/A'
-                    except Exception as e:
-                        print(f"Error extracting condition: {e}")
-                        item_data['condition'] = 'N/A'
-
-                    # Only add if we have at least a URL or item_name
-                    if item_data.get('url') != 'N/A' or item_data.get('item_name') != 'N/A':
-                        results.append(item_data)
-                        print(f"Extracted item {len(results)}: {item_data.get('item_name', 'N/A')[:50]}")
-                        print(f"  URL: {item_data.get('url', 'N/A')[:80]}")
-                        print(f"  Price: {item_data.get('price', 'N/A')}, Seller: {item_data.get('seller', 'N/A')}, Time: {item_data.get('time', 'N/A')}, Condition: {item_data.get('condition', 'N/A')}")
+                    WebDriverWait(self.driver, 30).until(
+                        lambda driver: driver.execute_script("return document.readyState") == 'complete'
+                    )
+                except TimeoutException:
+                    logger.warning("Page load timeout for %r - continuing anyway...", query)
 
+                try:
+                    results[query] = self._scrape_current_page(max_results)
                 except Exception as e:
-                    print(f"Error extracting data from listing {idx}: {str(e)}")
-                    continue
+                    logger.error("Error during scraping %r: %s", query, e)
+                finally:
+                    self.driver.close()
 
-                # Small delay between processing items (only for larger batches)
-                if max_results > 20 and idx % 10 == 0 and idx > 0:
-                    time.sleep(random.uniform(0.3, 0.5))
-
-            # Restore implicit wait
-            self.driver.implicitly_wait(3)
+        except Exception as e:
+            logger.error("Error during multi-tab scraping: %s", e)
 
-            print(f"Successfully extracted {len(results)} items")
+        finally:
+            # Leave only the main tab open and focused, even after a failure,
+            # so a pooled scraper goes back to the pool in a usable state
+            if main_window is not None:
+                try:
+                    for handle in self.driver.window_handles:
+                        if handle != main_window:
+                            self.driver.switch_to.window(handle)
+                            self.driver.close()
+                    self.driver.switch_to.window(main_window)
+                except Exception as e:
+                    logger.warning("Could not close search tabs: %s", e)
 
-        except Exception as e:
-            print(f"Error during scraping: {str(e)}")
-            # Restore implicit wait even on error
-            if self.driver:
-                self.driver.implicitly_wait(3)
+        # Empty results are not cached, they are often a CAPTCHA page
+        if self.cache is not None:
+            for query in pending:
+                if results[query]:
+                    self.cache.set(query, max_results, results[query])
 
         return results
 
+    def reset(self):
+        """
+        Clear per-search state so the browser can be reused for another search
+
+        If the browser has become unusable it is closed, and the next search
+        will start a fresh one.
+        """
+        self.debug_screenshot = None
+
+        if self.driver is None:
+            return
+
+        try:
+            self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+        except Exception as e:
+            logger.warning("Could not reset browser, restarting it: %s", e)
+            try:
+                self.close()
+            except Exception:
+                self.driver = None
+
     def close(self):
         """Close the browser driver"""
         if self.driver:
             self.driver.quit()
             self.driver = None
-            print("Browser closed")
+            logger.info("Browser closed")
+
+    def release_profile(self):
+        """
+        Give up the persistent profile slot this scraper claimed
+
+        Call this once the scraper is done for good, so another scraper can
+        reuse the slot. A temporary profile is deleted. close() alone keeps the slot, so a browser restarted
+        after close() comes back with the same profile.
+        """
+        if self._profile_lock is not None:
+            _unlock(self._profile_lock)
+            self._profile_lock = None
+            self.profile_dir = None
+        elif self._temp_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self._temp_profile = False
+            self.profile_dir = None
 
     def __enter__(self):
         """Context manager entry"""
@@ -727,13 +1171,232 @@ class CarousellScraper:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.close()
+        try:
+            self.close()
+        finally:
+            self.release_profile()
+
+
+class BrowserPool:
+    """Pool of pre-warmed scrapers that are reused across searches"""
+
+    def __init__(self, size: int = 1, headless: bool = True, browser: Optional[str] = None,
+                 browser_args: Optional[List[str]] = None, max_uses: int = MAX_USES_PER_INSTANCE):
+        """
+        Initialize the pool and start all of its browsers
+
+        Args:
+            size: Number of browsers to keep open
+            headless: Run browsers in headless mode
+            browser: Browser to use ('chrome', 'firefox', or None for auto-detect)
+            browser_args: Extra Chrome command-line flags for every browser
+            max_uses: Searches after which a browser is restarted (0 to never restart)
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self._available = queue.Queue()
+        self._scrapers = []
+        self._uses = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+        def start_browser() -> CarousellScraper:
+            scraper = CarousellScraper(headless=headless, browser=browser, browser_args=browser_args)
+            try:
+                scraper.warm_up()
+            except Exception:
+                self._quit(scraper)
+                raise
+            return scraper
+
+        # Browser startup is mostly waiting on Chrome, so start them all at once
+        logger.info("Starting browser pool with %d browser(s)...", size)
+        with ThreadPoolExecutor(max_workers=max(1, size)) as executor:
+            futures = [executor.submit(start_browser) for _ in range(size)]
+        error = None
+        for future in futures:
+            try:
+                scraper = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            self._scrapers.append(scraper)
+            self._uses[scraper] = 0
+            self._available.put(scraper)
+        if error is not None:
+            self.close()
+            raise error
+
+    @staticmethod
+    def _quit(scraper: CarousellScraper):
+        """Close a scraper's browser and free its profile slot for good"""
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.error("Error closing browser: %s", e)
+            scraper.driver = None
+        scraper.release_profile()
+
+    def acquire(self, timeout: Optional[float] = 30) -> CarousellScraper:
+        """
+        Take a scraper out of the pool, waiting for one to become free
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait forever
+
+        Returns:
+            A scraper with a running browser
+        """
+        try:
+            scraper = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"No browser became available within {timeout} seconds")
+        if scraper is None:
+            # close() leaves one None behind; pass it on to the next waiter
+            self._available.put(None)
+            raise RuntimeError("Browser pool is closed")
+        return scraper
+
+    def release(self, scraper: CarousellScraper):
+        """
+        Reset a scraper and return it to the pool
+
+        Once a scraper has done max_uses searches its browser is closed instead,
+        and the scraper starts a fresh one on its next search. Scrapers handed
+        back after the pool was closed are shut down instead.
+        """
+        with self._lock:
+            closed = self._closed
+        if closed:
+            self._quit(scraper)
+            return
+
+        self._uses[scraper] += 1
+        if self.max_uses and self._uses[scraper] >= self.max_uses:
+            logger.info("Restarting browser after %d searches...", self._uses[scraper])
+            self._uses[scraper] = 0
+            scraper.debug_screenshot = None
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.error("Error closing browser: %s", e)
+                scraper.driver = None
+        else:
+            scraper.reset()
+
+        with self._lock:
+            if not self._closed:
+                self._available.put(scraper)
+                return
+        self._quit(scraper)
+
+    def close(self):
+        """
+        Close the pool and free the profile slots of its browsers
+
+        Idle browsers are closed right away. Browsers checked out for a search
+        keep running until their search finishes and are closed in release().
+        """
+        with self._lock:
+            self._closed = True
+            idle = []
+            while True:
+                try:
+                    scraper = self._available.get_nowait()
+                except queue.Empty:
+                    break
+                if scraper is not None:
+                    idle.append(scraper)
+            # Wakes up acquire() calls that are waiting for a browser
+            self._available.put(None)
+
+        for scraper in idle:
+            self._quit(scraper)
+
+
+async def search_batch(pool: BrowserPool, queries: List[str], max_results: int = 20,
+                       max_concurrency: int = 5,
+                       debug_screenshots: Optional[Dict[str, bytes]] = None) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Run several searches concurrently using browsers from a pool
+
+    Each search runs in a worker thread with its own browser, so at most
+    min(max_concurrency, pool.size) searches are in flight at once.
+
+    Args:
+        pool: Browser pool to borrow scrapers from
+        queries: Search terms
+        max_results: Maximum number of results per search term
+        max_concurrency: Maximum number of searches running at the same time
+        debug_screenshots: Optional dict that receives the debug screenshot of
+            every search that found no listings, keyed by search term
+
+    Returns:
+        Dictionary mapping each search term to its list of results
+    """
+    queries = list(dict.fromkeys(queries))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+
+    def run_search(query: str) -> List[Dict[str, str]]:
+        scraper = pool.acquire(timeout=None)
+        try:
+            results = scraper.search(query, max_results)
+            if debug_screenshots is not None and scraper.debug_screenshot:
+                debug_screenshots[query] = scraper.debug_screenshot
+            return results
+        finally:
+            pool.release(scraper)
+
+    async def bounded_search(query: str) -> List[Dict[str, str]]:
+        async with semaphore:
+            return await loop.run_in_executor(None, run_search, query)
+
+    # One failed search (e.g. a browser that crashed) shouldn't discard the others
+    results = await asyncio.gather(*(bounded_search(query) for query in queries),
+                                   return_exceptions=True)
+    results_by_query = {}
+    for query, result in zip(queries, results):
+        if isinstance(result, Exception):
+            logger.error("Search for %r failed: %s", query, result)
+            result = []
+        results_by_query[query] = result
+    return results_by_query
+
+
+_shared_pools: Dict[bool, BrowserPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def get_shared_pool(headless: bool = True) -> BrowserPool:
+    """
+    Return the process-wide browser pool used by scrape_carousell
+
+    The pool is started on first use and its browsers are closed when the
+    interpreter exits.
+
+    Args:
+        headless: Run browsers in headless mode
+
+    Returns:
+        The shared pool for this headless setting
+    """
+    with _shared_pools_lock:
+        pool = _shared_pools.get(headless)
+        if pool is None:
+            pool = BrowserPool(size=1, headless=headless)
+            atexit.register(pool.close)
+            _shared_pools[headless] = pool
+        return pool
 
 
 def scrape_carousell(query: str, max_results: int = 20, headless: bool = True) -> List[Dict[str, str]]:
     """
     Convenience function to scrape Carousell
 
+    Repeated calls reuse a warm browser from the shared pool instead of
+    starting a new one for every search.
+
     Args:
         query: Search term
         max_results: Maximum number of results
@@ -742,5 +1405,32 @@ def scrape_carousell(query: str, max_results: int = 20, headless: bool = True) -
     Returns:
         List of product dictionaries
     """
-    with CarousellScraper(headless=headless) as scraper:
+    pool = get_shared_pool(headless)
+    scraper = pool.acquire(timeout=None)
+    try:
         return scraper.search(query, max_results)
+    finally:
+        pool.release(scraper)
+
+
+def scrape_many(queries: List[str], max_results: int = 20, headless: bool = True) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Convenience function to scrape several search terms at once
+
+    The search pages load in parallel tabs of the shared pool's warm browser,
+    so they share one browser process and its open connections to Carousell.
+
+    Args:
+        queries: Search terms
+        max_results: Maximum number of results per search term
+        headless: Run browser in headless mode
+
+    Returns:
+        Dictionary mapping each search term to its list of product dictionaries
+    """
+    pool = get_shared_pool(headless)
+    scraper = pool.acquire(timeout=None)
+    try:
+        return scraper.search_many(queries, max_results)
+    finally:
+        pool.release(scraper)
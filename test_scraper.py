@@ -2,68 +2,51 @@
 """
 Simple test script for Carousell scraper
 No Streamlit needed - runs entirely in terminal
+Install the project first (pip install -e .) so the scraper module can be imported
 """
 
-from src.carousell_scraper import scrape_carousell
-import pandas as pd
+import csv
+import logging
+import sys
+
+from carousell_scraper import scrape_carousell, scrape_many
 
 
 def main():
+    # Scraper progress is logged at INFO; pass --verbose to see it
+    verbose = '--verbose' in sys.argv[1:]
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format="%(message)s")
+
     print("=" * 70)
     print(" CAROUSELL.SG SCRAPER - SIMPLE TEST ")
     print("=" * 70)
     print()
 
-    # Get search term from user
-    search_term = input("Enter search term (or press Enter for 'laptop'): ").strip()
-    if not search_term:
-        search_term = "laptop"
+    # Get search terms from user
+    search_input = input("Enter search term(s), separated by commas (or press Enter for 'laptop'): ").strip()
+    search_terms = [term.strip() for term in search_input.split(",") if term.strip()] or ["laptop"]
 
     # Get max results
     max_str = input("Max results (or press Enter for '10'): ").strip()
     max_results = int(max_str) if max_str.isdigit() else 10
 
     print()
-    print(f"Searching for '{search_term}' (max {max_results} results)...")
+    print(f"Searching for {', '.join(repr(term) for term in search_terms)} (max {max_results} results each)...")
     print("This may take 30-60 seconds. Please wait...")
     print()
 
     try:
-        # Run the scraper
-        results = scrape_carousell(
-            query=search_term,
-            max_results=max_results,
-            headless=True  # No GUI needed - perfect for WSL2!
-        )
-
-        print()
-        print("=" * 70)
-        print(" RESULTS ")
-        print("=" * 70)
-        print()
-
-        if results:
-            # Convert to DataFrame for nice formatting
-            df = pd.DataFrame(results)
-
-            print(f"Found {len(results)} items:\n")
-
-            # Print each result
-            for i, row in df.iterrows():
-                print(f"{i+1}. {row['name']}")
-                print(f"   Price: {row['price']}")
-                print(f"   URL: {row['url']}")
-                print()
-
-            # Save to CSV
-            csv_filename = f"carousell_{search_term.replace(' ', '_')}_results.csv"
-            df.to_csv(csv_filename, index=False)
-            print("=" * 70)
-            print(f"✓ Results saved to: {csv_filename}")
-            print("=" * 70)
-
+        # Run the scraper; several terms load in parallel tabs of one browser
+        if len(search_terms) > 1:
+            results_by_term = scrape_many(search_terms, max_results=max_results, headless=True)
         else:
-            print("No results found. Try a different search term.")
+            results_by_term = {
+                search_terms[0]: scrape_carousell(
+                    query=search_terms[0],
+                    max_results=max_results,
+                    headless=True  # No GUI needed - perfect for WSL2!
+                )
+            }
 
     except Exception as e:
         print()
@@ -80,6 +63,42 @@ def main():
             print("  sudo apt update && sudo apt install -y firefox")
 
         print()
+        return
+
+    for search_term, results in results_by_term.items():
+        show_results(search_term, results)
+
+
+def show_results(search_term: str, results: list):
+    """Print the results of one search term and save them to CSV"""
+    print()
+    print("=" * 70)
+    print(f" RESULTS: {search_term} ")
+    print("=" * 70)
+    print()
+
+    if results:
+        print(f"Found {len(results)} items:\n")
+
+        # Print each result
+        for i, item in enumerate(results, 1):
+            print(f"{i}. {item['item_name']}")
+            print(f"   Price: {item['price']}")
+            print(f"   URL: {item['url']}")
+            print()
+
+        # Save to CSV
+        csv_filename = f"carousell_{search_term.replace(' ', '_')}_results.csv"
+        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0]))
+            writer.writeheader()
+            writer.writerows(results)
+        print("=" * 70)
+        print(f"✓ Results saved to: {csv_filename}")
+        print("=" * 70)
+
+    else:
+        print("No results found. Try a different search term.")
 
 
 if __name__ == "__main__":
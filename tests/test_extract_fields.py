@@ -0,0 +1,98 @@
+"""Tests for the listing card parsers"""
+
+from carousell_scraper import (
+    _extract_fields,
+    _pick_condition,
+    _pick_price,
+    _pick_seller,
+    _pick_time,
+    _pick_title,
+)
+
+
+BASE_URL = "https://www.carousell.sg"
+
+CARD_TEXT = "\n".join([
+    "techdeals",
+    "3 hours ago",
+    "Buyer Protection",
+    "MacBook Air M2 13-inch 256GB",
+    "S$1,200",
+    "Like new",
+])
+
+
+def split(text):
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    return lines, [line.lower() for line in lines]
+
+
+def listing(text=CARD_TEXT, **fields):
+    """A card as _EXTRACT_LISTINGS_JS returns it, with no selector matches"""
+    card = {
+        'tag': 'div', 'url': '/p/macbook-air-123', 'text': text, 'html_price': None,
+        'title': None, 'price': None, 'seller': None, 'time': None, 'condition': None,
+    }
+    card.update(fields)
+    return card
+
+
+def test_pick_title_skips_badge_after_time():
+    assert _pick_title(*split(CARD_TEXT)) == "MacBook Air M2 13-inch 256GB"
+
+
+def test_pick_title_rejects_price_line():
+    assert _pick_title(*split("seller\n1 day ago\nS$50")) is None
+
+
+def test_pick_price():
+    assert _pick_price("Item\nS$1,200.50", "item\ns$1,200.50") == "S$1,200.50"
+    assert _pick_price("Item\nMake Offer", "item\nmake offer") == "Make Offer"
+    assert _pick_price("Item", "item") is None
+
+
+def test_pick_seller():
+    assert _pick_seller(*split(CARD_TEXT)) == "techdeals"
+    assert _pick_seller(*split("Item\n@someone")) == "@someone"
+
+
+def test_pick_time():
+    lines, lines_lower = split(CARD_TEXT)
+    assert _pick_time(CARD_TEXT, lines, lines_lower) == "3 hours ago"
+
+
+def test_pick_condition_ignores_keyword_inside_title():
+    assert _pick_condition(*split("Brand new condition laptop with charger and case included\nS$5")) is None
+
+
+def test_pick_condition_prefers_keyword_priority_over_line_order():
+    assert _pick_condition(*split("Heavily used\nLike new")) == "Like new"
+
+
+def test_extract_fields_from_text():
+    item = _extract_fields(listing(), BASE_URL)
+
+    assert item == {
+        'url': BASE_URL + "/p/macbook-air-123",
+        'item_name': "MacBook Air M2 13-inch 256GB",
+        'price': "S$1,200",
+        'seller': "techdeals",
+        'time': "3 hours ago",
+        'condition': "Like new",
+    }
+
+
+def test_extract_fields_prefers_selector_and_html_matches():
+    item = _extract_fields(
+        listing(html_price="SGD 999", seller="@shop", url=BASE_URL + "/p/1"), BASE_URL
+    )
+
+    assert item['price'] == "S$ 999"
+    assert item['seller'] == "@shop"
+    assert item['url'] == BASE_URL + "/p/1"
+
+
+def test_extract_fields_marks_missing_fields():
+    item = _extract_fields(listing(text="", url=None), BASE_URL)
+
+    assert set(item.values()) == {'N/A'}
@@ -0,0 +1,76 @@
+"""Tests for search_batch with a stub browser pool"""
+
+import asyncio
+import threading
+
+from carousell_scraper import search_batch
+
+
+class StubScraper:
+    """Returns one result per query and fails for queries starting with 'fail'"""
+
+    def __init__(self, searched):
+        self.searched = searched
+        self.debug_screenshot = None
+
+    def search(self, query, max_results=20):
+        self.searched.append(query)
+        if query.startswith('fail'):
+            raise RuntimeError("browser crashed")
+        if query == 'nothing':
+            self.debug_screenshot = b'png'
+            return []
+        return [{'item_name': query, 'price': 'S$1', 'url': 'N/A'}]
+
+
+class StubPool:
+    """Hands out a fixed set of stub scrapers and checks they all come back"""
+
+    def __init__(self, size=2):
+        self.size = size
+        self.searched = []
+        self.idle = [StubScraper(self.searched) for _ in range(size)]
+        self.lock = threading.Lock()
+        self.available = threading.Semaphore(size)
+
+    def acquire(self, timeout=30):
+        self.available.acquire()
+        with self.lock:
+            return self.idle.pop()
+
+    def release(self, scraper):
+        # Like BrowserPool.release, which resets the scraper
+        scraper.debug_screenshot = None
+        with self.lock:
+            self.idle.append(scraper)
+        self.available.release()
+
+
+def test_failed_search_does_not_discard_others():
+    pool = StubPool()
+
+    results = asyncio.run(search_batch(pool, ['laptop', 'fail-1', 'phone']))
+
+    assert results['laptop'] == [{'item_name': 'laptop', 'price': 'S$1', 'url': 'N/A'}]
+    assert results['phone'] == [{'item_name': 'phone', 'price': 'S$1', 'url': 'N/A'}]
+    assert results['fail-1'] == []
+    # Every scraper went back to the pool, including the one that failed
+    assert len(pool.idle) == pool.size
+
+
+def test_duplicate_queries_are_searched_once():
+    pool = StubPool()
+
+    results = asyncio.run(search_batch(pool, ['laptop', 'phone', 'laptop']))
+
+    assert list(results) == ['laptop', 'phone']
+    assert sorted(pool.searched) == ['laptop', 'phone']
+
+
+def test_debug_screenshots_are_collected():
+    pool = StubPool(size=1)
+    screenshots = {}
+
+    asyncio.run(search_batch(pool, ['laptop', 'nothing'], debug_screenshots=screenshots))
+
+    assert screenshots == {'nothing': b'png'}
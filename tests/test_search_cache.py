@@ -0,0 +1,81 @@
+"""Tests for SearchCache and how CarousellScraper.search uses it"""
+
+import pytest
+
+import carousell_scraper
+from carousell_scraper import CarousellScraper, SearchCache
+
+
+RESULTS = [{'item_name': 'Laptop', 'price': 'S$500', 'url': 'https://www.carousell.sg/p/1'}]
+
+
+class StubDriver:
+    """Stands in for a WebDriver so search() never starts a browser"""
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SearchCache(tmp_path / "cache.sqlite3", ttl=60)
+
+
+@pytest.fixture
+def scraper(cache, monkeypatch):
+    scraper = CarousellScraper(cache=cache)
+    scraper.driver = StubDriver()
+    scraper.pages_scraped = 0
+
+    def scrape_current_page(max_results):
+        scraper.pages_scraped += 1
+        return scraper.page_results
+
+    monkeypatch.setattr(scraper, '_navigate', lambda url: None)
+    monkeypatch.setattr(scraper, '_scrape_current_page', scrape_current_page)
+    scraper.page_results = RESULTS
+    yield scraper
+    scraper.driver = None
+
+
+def test_results_expire_after_ttl(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(carousell_scraper.time, 'time', lambda: now[0])
+
+    cache.set("laptop", 20, RESULTS)
+    now[0] += 59
+    assert cache.get("laptop", 20) == RESULTS
+    now[0] += 2
+    assert cache.get("laptop", 20) is None
+
+
+def test_key_normalizes_query(cache):
+    cache.set("  Gaming   Laptop ", 20, RESULTS)
+
+    assert cache.get("gaming laptop", 20) == RESULTS
+    assert cache.get("GAMING LAPTOP", 20) == RESULTS
+    # max_results is part of the key
+    assert cache.get("gaming laptop", 10) is None
+
+
+def test_search_does_not_store_empty_results(scraper, cache):
+    scraper.page_results = []
+
+    assert scraper.search("laptop") == []
+    assert cache.get("laptop", 20) is None
+
+
+def test_search_reuses_cached_results(scraper, cache):
+    assert scraper.search("laptop") == RESULTS
+    assert scraper.search("laptop") == RESULTS
+    assert scraper.pages_scraped == 1
+    assert cache.get("laptop", 20) == RESULTS
+
+
+def test_search_bypasses_cache_when_asked(scraper, cache):
+    cache.set("laptop", 20, [{'item_name': 'Old', 'price': 'S$1', 'url': 'N/A'}])
+
+    assert scraper.search("laptop", use_cache=False) == RESULTS
+    assert scraper.pages_scraped == 1
+    # The fresh results replace the cached ones
+    assert cache.get("laptop", 20) == RESULTS